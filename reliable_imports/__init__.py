@@ -5,10 +5,11 @@ A convention-based Python framework for reliable data ingestion with PostgreSQL.
 Designed to save developer time through batch processing, import IDs, and easy reprocessing.
 """
 
+# Defined before the submodule imports: api_manager imports it from here.
+__version__ = "1.0.0"
+
 from .models import ImportBatch, ImportBatchItem, BatchStatus, ItemStatus
-from .batch import BatchManager
 from .processor import BaseProcessor
-from .context import ImportContext
 from .registry import ProcessorRegistry, processor
 from .exceptions import (
     ImportError,
@@ -18,11 +19,35 @@ from .exceptions import (
 )
 
 # REST API components
-from .api_manager import APIManager
 from .endpoint import BaseEndpoint, EndpointContext
 from .api_registry import EndpointRegistry, endpoint, get_endpoint_registry
 
-__version__ = "1.0.0"
+# Classes that pull in psycopg2 are imported on first access (PEP 562), so
+# code that only needs the registries, models or endpoint base classes does
+# not pay for the database stack.
+_LAZY_IMPORTS = {
+    "BatchManager": ".batch",
+    "ImportContext": ".context",
+    "APIManager": ".api_manager",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Core classes
     "ImportBatch",
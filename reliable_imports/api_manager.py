@@ -5,12 +5,22 @@ This module provides auto-generated REST APIs for batch operations,
 with support for custom endpoint behavior overrides.
 """
 
+import asyncio
+import inspect
 import logging
-from typing import List, Optional
+import time
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+
+import orjson
+from pydantic import BaseModel, ValidationError as PydanticValidationError
 
 from . import __version__
 from .api_models import (
@@ -23,7 +33,6 @@ from .api_models import (
     BatchResponse,
     BatchSummaryResponse,
     BatchListResponse,
-    ErrorResponse,
     HealthResponse,
     BatchItemResponse,
 )
@@ -35,10 +44,67 @@ from .exceptions import (
     ProcessorNotFoundError,
     ValidationError as ImportValidationError,
 )
-from .models import BatchStatus, ItemStatus
+from .models import BatchStatus, BatchSummary, ItemStatus
 from .registry import ProcessorRegistry
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively (UUID and datetime are)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, which encodes straight to bytes."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def _error_response(status_code: int, error: str, exc: Exception) -> Response:
+    return Response(
+        content=orjson.dumps({"error": error, "message": str(exc), "details": None}),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _where(batch_type: bool, status: bool) -> str:
+    clauses = [
+        clause
+        for clause, present in (("batch_type = %s", batch_type), ("status = %s", status))
+        if present
+    ]
+    return " AND ".join(clauses) if clauses else "1=1"
+
+
+# list_batches filters on any combination of batch_type and status, so the
+# four statement variants are built once, keyed by which filters are present.
+_LIST_BATCHES_SQL = {
+    (batch_type, status): f"""
+        SELECT id, batch_type, status, created_at, started_at, completed_at,
+               retry_count, total_items, completed_items, failed_items,
+               pending_items, duration_seconds, COUNT(*) OVER () AS total_count
+        FROM import_batch_summary
+        WHERE {_where(batch_type, status)}
+        ORDER BY created_at DESC
+        LIMIT %s OFFSET %s
+    """
+    for batch_type in (False, True)
+    for status in (False, True)
+}
+_COUNT_BATCHES_SQL = {
+    (batch_type, status): (
+        f"SELECT COUNT(*) FROM import_batches WHERE {_where(batch_type, status)}"
+    )
+    for batch_type in (False, True)
+    for status in (False, True)
+}
+
+
 class APIManager:
     """
     Manages REST API endpoints for the Reliable Imports framework.
@@ -51,6 +117,9 @@ class APIManager:
     - Custom endpoint hooks for validation, notifications, etc.
     - Comprehensive error handling
     - OpenAPI/Swagger documentation
+
+    Route handlers are async; blocking database work runs in FastAPI's
+    threadpool so it never stalls the event loop.
     """
 
     def __init__(
@@ -61,6 +130,10 @@ class APIManager:
         title: str = "Reliable Imports API",
         description: str = "Auto-generated REST API for batch data imports",
         version: str = __version__,
+        background_processing: bool = False,
+        health_cache_ttl: float = 2.0,
+        create_coalesce_window: float = 0.0,
+        create_coalesce_max: int = 16,
     ):
         """
         Initialize the API manager.
@@ -72,10 +145,34 @@ class APIManager:
             title: API title for OpenAPI docs
             description: API description for OpenAPI docs
             version: API version
+            background_processing: Process batches after the response has
+                been sent. Process requests then return 202 Accepted and
+                clients poll GET /api/batches/{batch_id} for the outcome.
+            health_cache_ttl: Seconds a /health result is reused before the
+                database is checked again (0 disables caching). Load
+                balancer probes hit this endpoint constantly.
+            create_coalesce_window: Seconds to hold a create request so
+                others arriving meanwhile are inserted in the same
+                transaction (e.g. 0.05). 0 disables coalescing. Clients can
+                opt out per request with `?sync=true`.
+            create_coalesce_max: Number of batches that triggers an
+                immediate insert instead of waiting for the window to end.
         """
         self.batch_manager = batch_manager
+        self.background_processing = background_processing
         self.endpoint_registry = endpoint_registry or get_endpoint_registry()
         self.logger = logger or logging.getLogger(__name__)
+        self._startup_hooks: List[Callable[[], Any]] = []
+        self._shutdown_hooks: List[Callable[[], Any]] = []
+        self._endpoints: Dict[str, BaseEndpoint] = {}
+        self._summary_fetches: Dict[UUID, "asyncio.Future[BatchSummary]"] = {}
+        self.health_cache_ttl = health_cache_ttl
+        self._health: Optional[Tuple[float, HealthResponse]] = None
+        self.create_coalesce_window = create_coalesce_window
+        self.create_coalesce_max = create_coalesce_max
+        self._pending_creates: List[Tuple[Dict[str, Any], "asyncio.Future[UUID]"]] = []
+        self._create_flush: Optional[asyncio.TimerHandle] = None
+        self._create_tasks: Set["asyncio.Task[None]"] = set()
 
         # Create FastAPI app
         self.app = FastAPI(
@@ -84,18 +181,262 @@ class APIManager:
             version=version,
             docs_url="/docs",
             redoc_url="/redoc",
+            lifespan=self._lifespan,
         )
 
         # Register routes
         self._register_routes()
         self._register_error_handlers()
 
+    def on_startup(self, func: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Register a callable to run when the server starts.
+
+        The callable may be sync or async. Can be used as a decorator.
+        """
+        self._startup_hooks.append(func)
+        return func
+
+    def on_shutdown(self, func: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Register a callable to run when the server shuts down.
+
+        The callable may be sync or async. Can be used as a decorator.
+        """
+        self._shutdown_hooks.append(func)
+        return func
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Run registered startup hooks, serve, then run shutdown hooks."""
+        for hook in self._startup_hooks:
+            await self._call_hook(hook)
+        try:
+            yield
+        finally:
+            for hook in reversed(self._shutdown_hooks):
+                await self._call_hook(hook)
+
     def _get_custom_endpoint(self, batch_type: str) -> Optional[BaseEndpoint]:
-        """Get custom endpoint instance for a batch type, if registered."""
+        """
+        Get the custom endpoint instance for a batch type, if registered.
+
+        One instance per batch type is created on first use and reused for
+        later requests. It is replaced if a different class is registered.
+        """
         endpoint_class = self.endpoint_registry.get(batch_type)
-        if endpoint_class:
-            return endpoint_class()
-        return None
+        if endpoint_class is None:
+            return None
+
+        instance = self._endpoints.get(batch_type)
+        if type(instance) is not endpoint_class:
+            instance = self._endpoints[batch_type] = endpoint_class()
+        return instance
+
+    def clear_endpoint_cache(self):
+        """Drop cached endpoint instances so they are recreated on next use."""
+        self._endpoints.clear()
+
+    async def _get_batch_summary_shared(self, batch_id: UUID) -> BatchSummary:
+        """
+        Fetch a batch summary, sharing the query between concurrent callers.
+
+        Clients commonly poll the same batch; while one fetch for a batch id
+        is in flight, other requests for it await that fetch instead of
+        issuing their own query.
+        """
+        future = self._summary_fetches.get(batch_id)
+        if future is None:
+            future = asyncio.ensure_future(
+                run_in_threadpool(self.batch_manager.get_batch_summary, batch_id)
+            )
+            self._summary_fetches[batch_id] = future
+
+            def forget(done: "asyncio.Future[BatchSummary]"):
+                if self._summary_fetches.get(batch_id) is done:
+                    del self._summary_fetches[batch_id]
+
+            future.add_done_callback(forget)
+
+        # Shielded so one client disconnecting does not cancel the others
+        return await asyncio.shield(future)
+
+    def _forget_batch_summary(self, batch_id: UUID):
+        """Make the next read of a batch start a fresh query after a write."""
+        self._summary_fetches.pop(batch_id, None)
+
+    async def _create_batch_coalesced(self, batch_args: Dict[str, Any]) -> UUID:
+        """
+        Queue a batch for creation together with other recent requests.
+
+        The first request opens a window of `create_coalesce_window` seconds;
+        every batch queued before it closes (or until `create_coalesce_max`
+        are waiting) is inserted by a single `create_batches()` call.
+        """
+        # Reject unknown types here so one bad request cannot fail the group
+        if not self.batch_manager.registry.has(batch_args["batch_type"]):
+            raise ProcessorNotFoundError(
+                f"No processor registered for batch type: {batch_args['batch_type']}"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_creates.append((batch_args, future))
+
+        if len(self._pending_creates) >= self.create_coalesce_max:
+            self._flush_creates()
+        elif self._create_flush is None:
+            self._create_flush = loop.call_later(
+                self.create_coalesce_window, self._flush_creates
+            )
+
+        return await future
+
+    def _flush_creates(self):
+        """Start inserting the queued batches."""
+        if self._create_flush is not None:
+            self._create_flush.cancel()
+            self._create_flush = None
+
+        pending, self._pending_creates = self._pending_creates, []
+        if pending:
+            task = asyncio.ensure_future(self._insert_pending_creates(pending))
+            self._create_tasks.add(task)
+            task.add_done_callback(self._create_tasks.discard)
+
+    async def _insert_pending_creates(
+        self, pending: List[Tuple[Dict[str, Any], "asyncio.Future[UUID]"]]
+    ):
+        """
+        Insert a group of queued batches and resolve their requests.
+
+        If the group's insert fails, each batch is retried on its own, so a
+        bad request (e.g. text Postgres rejects in a JSONB column) only
+        fails itself rather than everything queued with it.
+        """
+        try:
+            batch_ids = await run_in_threadpool(
+                self.batch_manager.create_batches, [args for args, _ in pending]
+            )
+        except Exception as e:
+            if len(pending) == 1:
+                _, future = pending[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+
+            for args, future in pending:
+                try:
+                    batch_id = await run_in_threadpool(
+                        self.batch_manager.create_batch, **args
+                    )
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result(batch_id)
+        else:
+            for (_, future), batch_id in zip(pending, batch_ids):
+                if not future.done():
+                    future.set_result(batch_id)
+
+    @staticmethod
+    async def _call_hook(hook: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call an endpoint or lifecycle hook without blocking the event loop.
+
+        Async hooks are awaited directly. Sync hooks may do blocking work
+        (a rate limit lookup, a notification) so they run in the threadpool,
+        except BaseEndpoint's own defaults, which return immediately.
+        """
+        if inspect.iscoroutinefunction(hook):
+            return await hook(*args)
+
+        func = getattr(hook, "__func__", None)
+        if func is not None and getattr(BaseEndpoint, func.__name__, None) is func:
+            result = hook(*args)
+        else:
+            result = await run_in_threadpool(hook, *args)
+
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _process_in_background(
+        self,
+        batch_id: UUID,
+        continue_on_error: bool,
+        custom_endpoint: Optional[BaseEndpoint],
+        ctx: Optional[EndpointContext],
+    ):
+        """Process a batch after the response was sent, then run the hooks."""
+        try:
+            result_summary = await run_in_threadpool(
+                self.batch_manager.process_batch,
+                batch_id,
+                continue_on_error=continue_on_error,
+            )
+            self._forget_batch_summary(batch_id)
+            if custom_endpoint:
+                await self._call_hook(
+                    custom_endpoint.after_batch_complete, batch_id, result_summary, ctx
+                )
+        except Exception as e:
+            # There is no client left to report to; the batch status records
+            # the failure.
+            self.logger.exception(f"Background processing of batch {batch_id} failed")
+            if custom_endpoint:
+                await self._call_hook(custom_endpoint.on_batch_error, batch_id, e, ctx)
+
+    def _check_database(self) -> str:
+        """Check that the database answers a trivial query."""
+        try:
+            with self.batch_manager._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+                    cur.fetchone()
+            return "connected"
+        except Exception as e:
+            return f"error: {str(e)}"
+
+    @staticmethod
+    def _summary_response(summary: BatchSummary) -> BatchSummaryResponse:
+        """
+        Build a BatchSummaryResponse from a summary read from the database.
+
+        Uses model_construct() to skip validation: every field comes from
+        our own typed BatchSummary, not from client input.
+        """
+        return BatchSummaryResponse.model_construct(
+            id=summary.id,
+            batch_type=summary.batch_type,
+            status=summary.status.value,
+            created_at=summary.created_at,
+            started_at=summary.started_at,
+            completed_at=summary.completed_at,
+            retry_count=summary.retry_count,
+            total_items=summary.total_items,
+            completed_items=summary.completed_items,
+            failed_items=summary.failed_items,
+            pending_items=summary.pending_items,
+            duration_seconds=summary.duration_seconds,
+            success_rate=summary.success_rate,
+            items_per_second=summary.items_per_second,
+        )
+
+    @staticmethod
+    def _respond(model: BaseModel, status_code: int = 200) -> ORJSONResponse:
+        """
+        Serialize a response model with orjson.
+
+        Routes declare their models through `responses=` for the OpenAPI
+        schema only and return the Response built here, so FastAPI never
+        re-validates or re-encodes the handler's return value. (Handlers are
+        left unannotated: FastAPI would infer a response_model from a return
+        annotation.)
+        """
+        return ORJSONResponse(model.model_dump(), status_code=status_code)
 
     def _create_endpoint_context(self, request: Request) -> EndpointContext:
         """Create endpoint context from request."""
@@ -112,15 +453,15 @@ class APIManager:
         @self.app.get("/", include_in_schema=False)
         async def root():
             """Root endpoint."""
-            return {
+            return ORJSONResponse({
                 "name": "Reliable Imports API",
                 "version": __version__,
                 "docs": "/docs",
-            }
+            })
 
         @self.app.get(
             "/health",
-            response_model=HealthResponse,
+            responses={200: {"model": HealthResponse}},
             tags=["System"],
             summary="Health check",
         )
@@ -130,49 +471,79 @@ class APIManager:
 
             Returns system status and available batch types.
             """
-            try:
-                # Test database connection
-                self.batch_manager._get_connection().close()
-                db_status = "connected"
-            except Exception as e:
-                db_status = f"error: {str(e)}"
+            now = time.monotonic()
+            if self._health is not None and now < self._health[0]:
+                return self._respond(self._health[1])
 
-            return HealthResponse(
+            # Test database connection
+            db_status = await run_in_threadpool(self._check_database)
+
+            health = HealthResponse(
                 status="healthy" if db_status == "connected" else "unhealthy",
                 version=__version__,
                 database=db_status,
                 registered_batch_types=self.batch_manager.registry.list_batch_types(),
             )
+            self._health = (now + self.health_cache_ttl, health)
+            return self._respond(health)
 
         @self.app.post(
             "/api/batches",
-            response_model=CreateBatchResponse,
+            responses={201: {"model": CreateBatchResponse}},
             tags=["Batches"],
             summary="Create a new batch",
             status_code=201,
+            openapi_extra={
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": CreateBatchRequest.model_json_schema()
+                        }
+                    },
+                }
+            },
         )
         async def create_batch(
-            request_data: CreateBatchRequest,
             request: Request,
+            background_tasks: BackgroundTasks,
+            sync: bool = Query(
+                False, description="Insert immediately instead of coalescing"
+            ),
         ):
             """
             Create a new import batch.
 
             Optionally auto-process the batch by setting `auto_process: true`.
             """
-            ctx = self._create_endpoint_context(request)
+            # Validate straight from the raw body: pydantic-core parses the
+            # JSON and builds the items once, rather than FastAPI decoding it
+            # into dicts first and pydantic copying every item again.
+            try:
+                request_data = CreateBatchRequest.model_validate_json(
+                    await request.body()
+                )
+            except PydanticValidationError as e:
+                raise RequestValidationError([
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ])
+
             custom_endpoint = self._get_custom_endpoint(request_data.batch_type)
+            ctx = self._create_endpoint_context(request) if custom_endpoint else None
 
             try:
                 # Call before_create_batch hook if custom endpoint exists
                 if custom_endpoint:
-                    if not custom_endpoint.check_rate_limit(ctx):
+                    if not await self._call_hook(custom_endpoint.check_rate_limit, ctx):
                         raise HTTPException(
                             status_code=429,
                             detail="Rate limit exceeded"
                         )
 
-                    max_size = custom_endpoint.get_max_batch_size(ctx)
+                    max_size = await self._call_hook(
+                        custom_endpoint.get_max_batch_size, ctx
+                    )
                     if max_size and len(request_data.items) > max_size:
                         raise HTTPException(
                             status_code=400,
@@ -180,8 +551,10 @@ class APIManager:
                         )
 
                     # Custom validation
-                    errors = custom_endpoint.validate_create_batch_items(
-                        request_data.items, ctx
+                    errors = await self._call_hook(
+                        custom_endpoint.validate_create_batch_items,
+                        request_data.items,
+                        ctx,
                     )
                     if errors:
                         raise HTTPException(
@@ -189,33 +562,68 @@ class APIManager:
                             detail={"errors": errors}
                         )
 
-                    request_data = custom_endpoint.before_create_batch(
-                        request_data, ctx
+                    request_data = await self._call_hook(
+                        custom_endpoint.before_create_batch, request_data, ctx
                     )
 
-                # Create the batch
-                batch_id = self.batch_manager.create_batch(
+                batch_args = dict(
                     batch_type=request_data.batch_type,
                     items=request_data.items,
                     source_info=request_data.source_info,
                     metadata=request_data.metadata,
                 )
+                status = BatchStatus.PENDING.value
+                process_now = (
+                    request_data.auto_process and not self.background_processing
+                )
+
+                if process_now and not custom_endpoint:
+                    # Nothing has to run between creating and processing the
+                    # batch, so do both on one connection, sharing the commit
+                    # that stores the batch
+                    batch_id, summary = await run_in_threadpool(
+                        self.batch_manager.create_and_process, **batch_args
+                    )
+                    status = summary.status.value
+                elif self.create_coalesce_window > 0 and not sync and not process_now:
+                    batch_id = await self._create_batch_coalesced(batch_args)
+                else:
+                    batch_id = await run_in_threadpool(
+                        self.batch_manager.create_batch, **batch_args
+                    )
 
                 # Call after_create_batch hook
                 if custom_endpoint:
-                    custom_endpoint.after_create_batch(batch_id, request_data, ctx)
+                    await self._call_hook(
+                        custom_endpoint.after_create_batch, batch_id, request_data, ctx
+                    )
 
-                # Auto-process if requested
-                status = BatchStatus.PENDING.value
-                if request_data.auto_process:
-                    self.batch_manager.process_batch(batch_id)
+                    # Process after the hook, which may prepare for it
+                    if process_now:
+                        summary = await run_in_threadpool(
+                            self.batch_manager.process_batch, batch_id
+                        )
+                        status = summary.status.value
+
+                # Auto-process in the background if requested
+                if request_data.auto_process and self.background_processing:
+                    background_tasks.add_task(
+                        self._process_in_background,
+                        batch_id,
+                        True,
+                        custom_endpoint,
+                        ctx,
+                    )
                     status = BatchStatus.PROCESSING.value
 
-                return CreateBatchResponse(
-                    batch_id=batch_id,
-                    batch_type=request_data.batch_type,
-                    total_items=len(request_data.items),
-                    status=status,
+                return self._respond(
+                    CreateBatchResponse(
+                        batch_id=batch_id,
+                        batch_type=request_data.batch_type,
+                        total_items=len(request_data.items),
+                        status=status,
+                    ),
+                    status_code=201,
                 )
 
             except ProcessorNotFoundError as e:
@@ -225,7 +633,7 @@ class APIManager:
 
         @self.app.get(
             "/api/batches/{batch_id}",
-            response_model=BatchSummaryResponse,
+            responses={200: {"model": BatchSummaryResponse}},
             tags=["Batches"],
             summary="Get batch details",
         )
@@ -235,44 +643,32 @@ class APIManager:
 
             Returns batch metadata and processing statistics.
             """
-            ctx = self._create_endpoint_context(request)
-
             try:
-                summary = self.batch_manager.get_batch_summary(batch_id)
+                summary = await self._get_batch_summary_shared(batch_id)
 
                 # Check access permissions
                 custom_endpoint = self._get_custom_endpoint(summary.batch_type)
                 if custom_endpoint:
-                    if not custom_endpoint.validate_batch_access(batch_id, ctx):
+                    ctx = self._create_endpoint_context(request)
+                    if not await self._call_hook(
+                        custom_endpoint.validate_batch_access, batch_id, ctx
+                    ):
                         raise HTTPException(status_code=403, detail="Access denied")
 
-                # Calculate derived fields
-                success_rate = summary.success_rate
-                items_per_second = summary.items_per_second
-
-                return BatchSummaryResponse(
-                    id=summary.id,
-                    batch_type=summary.batch_type,
-                    status=summary.status.value,
-                    created_at=summary.created_at,
-                    started_at=summary.started_at,
-                    completed_at=summary.completed_at,
-                    retry_count=summary.retry_count,
-                    total_items=summary.total_items,
-                    completed_items=summary.completed_items,
-                    failed_items=summary.failed_items,
-                    pending_items=summary.pending_items,
-                    duration_seconds=summary.duration_seconds,
-                    success_rate=success_rate,
-                    items_per_second=items_per_second,
-                )
+                return self._respond(self._summary_response(summary))
 
             except BatchNotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e))
 
         @self.app.post(
             "/api/batches/{batch_id}/process",
-            response_model=ProcessBatchResponse,
+            responses={
+                200: {"model": ProcessBatchResponse},
+                202: {
+                    "model": ProcessBatchResponse,
+                    "description": "Processing started in the background",
+                },
+            },
             tags=["Batches"],
             summary="Process a batch",
         )
@@ -280,57 +676,74 @@ class APIManager:
             batch_id: UUID,
             request_data: ProcessBatchRequest,
             request: Request,
+            background_tasks: BackgroundTasks,
         ):
             """
             Process a pending batch.
 
-            Processes all items in the batch and returns a summary.
+            Processes all items in the batch and returns a summary. With
+            background processing enabled, returns 202 Accepted as soon as
+            processing has been scheduled.
             """
-            ctx = self._create_endpoint_context(request)
+            custom_endpoint = None
+            ctx = None
 
             try:
-                # Get batch info for custom endpoint lookup
-                summary = self.batch_manager.get_batch_summary(batch_id)
-                custom_endpoint = self._get_custom_endpoint(summary.batch_type)
+                # Only the batch type is needed to find the custom endpoint
+                batch_type = await run_in_threadpool(
+                    self.batch_manager.get_batch_type, batch_id
+                )
+                custom_endpoint = self._get_custom_endpoint(batch_type)
 
                 # Check access and call before hook
                 if custom_endpoint:
-                    if not custom_endpoint.validate_batch_access(batch_id, ctx):
+                    ctx = self._create_endpoint_context(request)
+                    if not await self._call_hook(
+                        custom_endpoint.validate_batch_access, batch_id, ctx
+                    ):
                         raise HTTPException(status_code=403, detail="Access denied")
 
-                    request_data = custom_endpoint.before_process_batch(
-                        batch_id, request_data, ctx
+                    request_data = await self._call_hook(
+                        custom_endpoint.before_process_batch, batch_id, request_data, ctx
+                    )
+
+                if self.background_processing:
+                    background_tasks.add_task(
+                        self._process_in_background,
+                        batch_id,
+                        request_data.continue_on_error,
+                        custom_endpoint,
+                        ctx,
+                    )
+                    return self._respond(
+                        ProcessBatchResponse(
+                            batch_id=batch_id,
+                            status=BatchStatus.PROCESSING.value,
+                            message="Batch processing started",
+                        ),
+                        status_code=202,
                     )
 
                 # Process the batch
-                result_summary = self.batch_manager.process_batch(
+                result_summary = await run_in_threadpool(
+                    self.batch_manager.process_batch,
                     batch_id,
                     continue_on_error=request_data.continue_on_error,
                 )
+                self._forget_batch_summary(batch_id)
 
                 # Call after hook
                 if custom_endpoint:
-                    custom_endpoint.after_batch_complete(batch_id, result_summary, ctx)
-
-                return ProcessBatchResponse(
-                    batch_id=batch_id,
-                    status=result_summary.status.value,
-                    summary=BatchSummaryResponse(
-                        id=result_summary.id,
-                        batch_type=result_summary.batch_type,
+                    await self._call_hook(
+                        custom_endpoint.after_batch_complete, batch_id, result_summary, ctx
+                    )
+
+                return self._respond(
+                    ProcessBatchResponse(
+                        batch_id=batch_id,
                         status=result_summary.status.value,
-                        created_at=result_summary.created_at,
-                        started_at=result_summary.started_at,
-                        completed_at=result_summary.completed_at,
-                        retry_count=result_summary.retry_count,
-                        total_items=result_summary.total_items,
-                        completed_items=result_summary.completed_items,
-                        failed_items=result_summary.failed_items,
-                        pending_items=result_summary.pending_items,
-                        duration_seconds=result_summary.duration_seconds,
-                        success_rate=result_summary.success_rate,
-                        items_per_second=result_summary.items_per_second,
-                    ),
+                        summary=self._summary_response(result_summary),
+                    )
                 )
 
             except BatchNotFoundError as e:
@@ -338,12 +751,12 @@ class APIManager:
             except Exception as e:
                 # Call error hook
                 if custom_endpoint:
-                    custom_endpoint.on_batch_error(batch_id, e, ctx)
+                    await self._call_hook(custom_endpoint.on_batch_error, batch_id, e, ctx)
                 raise
 
         @self.app.post(
             "/api/batches/{batch_id}/reprocess",
-            response_model=ReprocessBatchResponse,
+            responses={200: {"model": ReprocessBatchResponse}},
             tags=["Batches"],
             summary="Reprocess a batch",
         )
@@ -357,49 +770,66 @@ class APIManager:
 
             Creates a new batch with failed items and processes them.
             """
-            ctx = self._create_endpoint_context(request)
+            custom_endpoint = None
+            ctx = None
 
             try:
-                # Get batch info for custom endpoint lookup
-                summary = self.batch_manager.get_batch_summary(batch_id)
-                custom_endpoint = self._get_custom_endpoint(summary.batch_type)
+                # Only the batch type is needed to find the custom endpoint
+                batch_type = await run_in_threadpool(
+                    self.batch_manager.get_batch_type, batch_id
+                )
+                custom_endpoint = self._get_custom_endpoint(batch_type)
 
                 # Check access and call before hook
                 if custom_endpoint:
-                    if not custom_endpoint.validate_batch_access(batch_id, ctx):
+                    ctx = self._create_endpoint_context(request)
+                    if not await self._call_hook(
+                        custom_endpoint.validate_batch_access, batch_id, ctx
+                    ):
                         raise HTTPException(status_code=403, detail="Access denied")
 
-                    request_data = custom_endpoint.before_reprocess_batch(
-                        batch_id, request_data, ctx
+                    request_data = await self._call_hook(
+                        custom_endpoint.before_reprocess_batch, batch_id, request_data, ctx
                     )
 
                 # Reprocess the batch
-                new_batch_id = self.batch_manager.reprocess_batch(
+                new_batch_id = await run_in_threadpool(
+                    self.batch_manager.reprocess_batch,
                     batch_id,
                     failed_items_only=request_data.failed_items_only,
                     continue_on_error=request_data.continue_on_error,
                 )
+                self._forget_batch_summary(batch_id)
+                self._forget_batch_summary(new_batch_id)
 
                 # Get new batch summary
-                new_summary = self.batch_manager.get_batch_summary(new_batch_id)
+                new_summary = await run_in_threadpool(
+                    self.batch_manager.get_batch_summary, new_batch_id
+                )
 
                 # Call after hook
                 if custom_endpoint:
-                    custom_endpoint.after_reprocess_complete(
-                        batch_id, new_batch_id, new_summary, ctx
+                    await self._call_hook(
+                        custom_endpoint.after_reprocess_complete,
+                        batch_id,
+                        new_batch_id,
+                        new_summary,
+                        ctx,
                     )
 
+                # The new batch holds exactly the items selected for
+                # reprocessing; the original id comes back when there were none
                 items_count = (
-                    summary.failed_items
-                    if request_data.failed_items_only
-                    else summary.total_items
+                    new_summary.total_items if new_batch_id != batch_id else 0
                 )
 
-                return ReprocessBatchResponse(
-                    original_batch_id=batch_id,
-                    new_batch_id=new_batch_id,
-                    items_to_reprocess=items_count,
-                    status=new_summary.status.value,
+                return self._respond(
+                    ReprocessBatchResponse(
+                        original_batch_id=batch_id,
+                        new_batch_id=new_batch_id,
+                        items_to_reprocess=items_count,
+                        status=new_summary.status.value,
+                    )
                 )
 
             except BatchNotFoundError as e:
@@ -407,12 +837,11 @@ class APIManager:
 
         @self.app.get(
             "/api/batches",
-            response_model=BatchListResponse,
+            responses={200: {"model": BatchListResponse}},
             tags=["Batches"],
             summary="List batches",
         )
         async def list_batches(
-            request: Request,
             batch_type: Optional[str] = Query(None, description="Filter by batch type"),
             status: Optional[str] = Query(None, description="Filter by status"),
             offset: int = Query(0, ge=0, description="Pagination offset"),
@@ -423,112 +852,111 @@ class APIManager:
 
             Supports pagination and filtering by batch type and status.
             """
-            ctx = self._create_endpoint_context(request)
-
-            # Build query
-            where_clauses = []
-            params = []
-
-            if batch_type:
-                where_clauses.append("batch_type = %s")
-                params.append(batch_type)
+            batches, total = await run_in_threadpool(
+                self._query_batches, batch_type, status, offset, limit
+            )
 
-            if status:
-                where_clauses.append("status = %s")
-                params.append(status)
+            # Rows are already shaped like BatchSummaryResponse, so the page
+            # goes straight to orjson without building a model per row
+            return ORJSONResponse(
+                {"batches": batches, "total": total, "offset": offset, "limit": limit}
+            )
 
-            where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+    def _query_batches(
+        self,
+        batch_type: Optional[str],
+        status: Optional[str],
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Query a page of batch summaries and the total matching count.
 
-            # Execute query
-            with self.batch_manager._get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Get total count
-                    cur.execute(
-                        f"SELECT COUNT(*) FROM import_batches WHERE {where_sql}",
-                        tuple(params),
-                    )
+        Returns:
+            Tuple of (batch summaries as BatchSummaryResponse-shaped dicts,
+            total count)
+        """
+        key = (bool(batch_type), bool(status))
+        params = tuple(value for value in (batch_type, status) if value)
+
+        # Execute query
+        with self.batch_manager._get_connection() as conn:
+            with conn.cursor() as cur:
+                # Get a page of batches, with the total match count computed
+                # in the same statement
+                cur.execute(_LIST_BATCHES_SQL[key], params + (limit, offset))
+                rows = cur.fetchall()
+
+                if rows:
+                    total = rows[0][-1]
+                elif offset:
+                    # Paged past the end: no row to carry the count
+                    cur.execute(_COUNT_BATCHES_SQL[key], params)
                     total = cur.fetchone()[0]
-
-                    # Get batches
-                    cur.execute(
-                        f"""
-                        SELECT * FROM import_batch_summary
-                        WHERE {where_sql}
-                        ORDER BY created_at DESC
-                        LIMIT %s OFFSET %s
-                        """,
-                        tuple(params + [limit, offset]),
-                    )
-
-                    batches = []
-                    for row in cur.fetchall():
-                        batches.append(
-                            BatchSummaryResponse(
-                                id=UUID(row[0]),
-                                batch_type=row[1],
-                                status=row[2],
-                                created_at=row[3],
-                                started_at=row[4],
-                                completed_at=row[5],
-                                retry_count=row[6],
-                                total_items=row[7],
-                                completed_items=row[8],
-                                failed_items=row[9],
-                                pending_items=row[10],
-                                duration_seconds=row[11],
-                                success_rate=(row[8] / row[7] * 100) if row[7] > 0 else 0,
-                                items_per_second=(row[7] / row[11]) if row[11] and row[11] > 0 else None,
-                            )
-                        )
-
-            return BatchListResponse(
-                batches=batches,
-                total=total,
-                offset=offset,
-                limit=limit,
-            )
+                else:
+                    total = 0
+
+                # Unpacked by name in the comprehension (the column list is
+                # spelled out in the SQL), which is cheaper than indexing each row
+                batches = [
+                    {
+                        "id": str(batch_id),
+                        "batch_type": row_type,
+                        "status": row_status,
+                        "created_at": created_at,
+                        "started_at": started_at,
+                        "completed_at": completed_at,
+                        "retry_count": retry_count,
+                        "total_items": total_items,
+                        "completed_items": completed_items,
+                        "failed_items": failed_items,
+                        "pending_items": pending_items,
+                        "duration_seconds": duration,
+                        "success_rate": (
+                            completed_items / total_items * 100 if total_items > 0 else 0.0
+                        ),
+                        "items_per_second": (
+                            total_items / duration if duration and duration > 0 else None
+                        ),
+                    }
+                    for (
+                        batch_id, row_type, row_status, created_at, started_at,
+                        completed_at, retry_count, total_items, completed_items,
+                        failed_items, pending_items, seconds, _,
+                    ) in rows
+                    for duration in (None if seconds is None else float(seconds),)
+                ]
+
+        return batches, total
 
     def _register_error_handlers(self):
         """Register global error handlers."""
 
         @self.app.exception_handler(BatchNotFoundError)
         async def batch_not_found_handler(request: Request, exc: BatchNotFoundError):
-            return JSONResponse(
-                status_code=404,
-                content=ErrorResponse(
-                    error="BatchNotFoundError",
-                    message=str(exc),
-                ).dict(),
-            )
+            return _error_response(404, "BatchNotFoundError", exc)
 
         @self.app.exception_handler(ProcessorNotFoundError)
         async def processor_not_found_handler(
             request: Request, exc: ProcessorNotFoundError
         ):
-            return JSONResponse(
-                status_code=400,
-                content=ErrorResponse(
-                    error="ProcessorNotFoundError",
-                    message=str(exc),
-                ).dict(),
-            )
+            return _error_response(400, "ProcessorNotFoundError", exc)
 
         @self.app.exception_handler(ImportValidationError)
         async def validation_error_handler(
             request: Request, exc: ImportValidationError
         ):
-            return JSONResponse(
-                status_code=400,
-                content=ErrorResponse(
-                    error="ValidationError",
-                    message=str(exc),
-                ).dict(),
-            )
+            return _error_response(400, "ValidationError", exc)
 
     def run(self, host: str = "0.0.0.0", port: int = 8000, **kwargs):
         """
         Run the API server using uvicorn.
 
+        uvicorn uses uvloop and httptools when they are installed (they are
+        part of uvicorn[standard]); pass `loop=` / `http=` to override. For
+        multiple worker processes run uvicorn with an import string instead
+        (see REST_API.md), since `workers=` cannot be used with an app object.
+
         Args:
             host: Host to bind to
             port: Port to bind to
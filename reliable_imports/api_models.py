@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CreateBatchRequest(BaseModel):
@@ -21,14 +21,15 @@ class CreateBatchRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional batch metadata")
     auto_process: bool = Field(False, description="Automatically start processing after creation")
 
-    @validator('items')
+    @field_validator('items')
+    @classmethod
     def validate_items_not_empty(cls, v):
         if not v:
             raise ValueError("items list cannot be empty")
         return v
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "batch_type": "customer_data",
                 "items": [
@@ -39,6 +40,7 @@ class CreateBatchRequest(BaseModel):
                 "auto_process": True
             }
         }
+    )
 
 
 class ProcessBatchRequest(BaseModel):
@@ -46,12 +48,13 @@ class ProcessBatchRequest(BaseModel):
 
     continue_on_error: bool = Field(True, description="Whether to continue processing if an item fails")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "continue_on_error": True
             }
         }
+    )
 
 
 class ReprocessBatchRequest(BaseModel):
@@ -60,13 +63,14 @@ class ReprocessBatchRequest(BaseModel):
     failed_items_only: bool = Field(True, description="Only reprocess items that failed")
     continue_on_error: bool = Field(True, description="Whether to continue processing if an item fails")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "failed_items_only": True,
                 "continue_on_error": True
             }
         }
+    )
 
 
 class BatchItemResponse(BaseModel):
@@ -84,8 +88,7 @@ class BatchItemResponse(BaseModel):
     processed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BatchResponse(BaseModel):
@@ -104,8 +107,7 @@ class BatchResponse(BaseModel):
     retry_count: int = 0
     parent_batch_id: Optional[UUID] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BatchSummaryResponse(BaseModel):
@@ -126,8 +128,7 @@ class BatchSummaryResponse(BaseModel):
     success_rate: float = Field(..., description="Success rate as a percentage (0-100)")
     items_per_second: Optional[float] = Field(None, description="Processing throughput")
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CreateBatchResponse(BaseModel):
@@ -139,8 +140,8 @@ class CreateBatchResponse(BaseModel):
     status: str
     message: str = "Batch created successfully"
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "batch_id": "550e8400-e29b-41d4-a716-446655440000",
                 "batch_type": "customer_data",
@@ -149,6 +150,7 @@ class CreateBatchResponse(BaseModel):
                 "message": "Batch created successfully"
             }
         }
+    )
 
 
 class ProcessBatchResponse(BaseModel):
@@ -156,11 +158,11 @@ class ProcessBatchResponse(BaseModel):
 
     batch_id: UUID
     status: str
-    summary: BatchSummaryResponse
+    summary: Optional[BatchSummaryResponse] = None  # None while processing in the background
     message: str = "Batch processing completed"
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "batch_id": "550e8400-e29b-41d4-a716-446655440000",
                 "status": "completed",
@@ -177,6 +179,7 @@ class ProcessBatchResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class ReprocessBatchResponse(BaseModel):
@@ -188,8 +191,8 @@ class ReprocessBatchResponse(BaseModel):
     status: str
     message: str = "Batch reprocessed successfully"
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "original_batch_id": "550e8400-e29b-41d4-a716-446655440000",
                 "new_batch_id": "660e8400-e29b-41d4-a716-446655440001",
@@ -198,6 +201,7 @@ class ReprocessBatchResponse(BaseModel):
                 "message": "Batch reprocessed successfully"
             }
         }
+    )
 
 
 class BatchListResponse(BaseModel):
@@ -208,8 +212,8 @@ class BatchListResponse(BaseModel):
     offset: int
     limit: int
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "batches": [],
                 "total": 10,
@@ -217,6 +221,7 @@ class BatchListResponse(BaseModel):
                 "limit": 20
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -226,14 +231,15 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Human-readable error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "BatchNotFoundError",
                 "message": "Batch not found: 550e8400-e29b-41d4-a716-446655440000",
                 "details": {"batch_id": "550e8400-e29b-41d4-a716-446655440000"}
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -244,8 +250,8 @@ class HealthResponse(BaseModel):
     database: str = Field(..., description="Database connection status")
     registered_batch_types: List[str] = Field(..., description="Available batch types")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
@@ -253,3 +259,4 @@ class HealthResponse(BaseModel):
                 "registered_batch_types": ["customer_data", "transaction_feed"]
             }
         }
+    )
@@ -8,9 +8,11 @@ following the same pattern as processor registration.
 import importlib
 import inspect
 import pkgutil
-from typing import Dict, Optional, Type
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
 
 from .endpoint import BaseEndpoint
+from .exceptions import ConfigurationError
 
 
 class EndpointRegistry:
@@ -19,12 +21,13 @@ class EndpointRegistry:
 
     The registry supports:
     - Manual registration via register()
-    - Automatic discovery via discover()
+    - Automatic discovery via discover() or discover_entry_points()
     - Convention-based lookup by batch_type
     """
 
     def __init__(self):
-        self._endpoints: Dict[str, Type[BaseEndpoint]] = {}
+        self._endpoints: Mapping[str, Type[BaseEndpoint]] = {}
+        self._frozen = False
 
     def register(
         self, batch_type: str, endpoint_class: Type[BaseEndpoint]
@@ -36,6 +39,11 @@ class EndpointRegistry:
             batch_type: The batch type identifier
             endpoint_class: The endpoint class to register
         """
+        if self._frozen:
+            raise ConfigurationError(
+                f"Cannot register {batch_type!r}: registry is frozen"
+            )
+
         if not issubclass(endpoint_class, BaseEndpoint):
             raise ValueError(
                 f"{endpoint_class.__name__} must inherit from BaseEndpoint"
@@ -63,6 +71,16 @@ class EndpointRegistry:
         """Get all batch types with custom endpoints."""
         return list(self._endpoints.keys())
 
+    def freeze(self) -> None:
+        """
+        Make the registry read-only once all custom endpoints are registered.
+
+        Lookups then go through a read-only mapping, and further register()
+        calls raise ConfigurationError.
+        """
+        self._endpoints = MappingProxyType(dict(self._endpoints))
+        self._frozen = True
+
     def discover(self, package_name: str) -> int:
         """
         Automatically discover and register custom endpoints in a package.
@@ -73,6 +91,10 @@ class EndpointRegistry:
         Convention: Classes should be named like `CustomerDataEndpoint`
         which will be registered for batch_type `customer_data`.
 
+        Every submodule of the package is imported, running its module-level
+        code. For installed packages, discover_entry_points() is faster and
+        only imports the endpoint classes themselves.
+
         Args:
             package_name: Python package to search (e.g., 'myapp.endpoints')
 
@@ -115,21 +137,78 @@ class EndpointRegistry:
 
         return count
 
+    def discover_entry_points(
+        self, group: str = "reliable_imports.endpoints"
+    ) -> int:
+        """
+        Register custom endpoints advertised through package entry points.
+
+        Each entry point in the group must reference a BaseEndpoint subclass,
+        e.g. in the providing package's pyproject.toml:
+
+            [project.entry-points."reliable_imports.endpoints"]
+            customer_data = "myapp.endpoints:CustomerDataEndpoint"
+
+        Only the referenced modules are imported, so this avoids the package
+        walk done by discover(). The class is registered for its batch_type.
+
+        Args:
+            group: Entry point group to load
+
+        Returns:
+            Number of endpoints discovered and registered
+
+        Raises:
+            ConfigurationError: If an entry point does not reference a
+                BaseEndpoint subclass
+        """
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            # Python 3.7: the importlib_metadata backport
+            from importlib_metadata import entry_points
+
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            eps = eps.select(group=group)
+        else:
+            # Before Python 3.10 entry_points() returns a dict keyed by group
+            eps = eps.get(group, ())
+
+        count = 0
+
+        for ep in eps:
+            obj = ep.load()
+            if not (inspect.isclass(obj) and issubclass(obj, BaseEndpoint)):
+                raise ConfigurationError(
+                    f"Entry point {ep.name!r} in group {group!r} does not "
+                    f"reference a BaseEndpoint subclass: {ep.value}"
+                )
+
+            self.register(obj.get_batch_type(), obj)
+            count += 1
+
+        return count
+
     def _register_endpoints_in_module(self, module) -> int:
         """Register all endpoint classes found in a module."""
         count = 0
 
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        # vars() rather than inspect.getmembers(): no getattr() per attribute
+        # and no sorting, just the module namespace in definition order
+        for obj in vars(module).values():
             # Check if it's an endpoint (but not the base class itself)
             if (
-                issubclass(obj, BaseEndpoint)
+                isinstance(obj, type)
+                and issubclass(obj, BaseEndpoint)
                 and obj is not BaseEndpoint
                 and obj.__module__ == module.__name__
             ):
-                # Create instance to get batch_type
-                instance = obj()
-                if instance.batch_type:
-                    self.register(instance.batch_type, obj)
+                # Read batch_type from the class; instantiating it here would
+                # run the endpoint's __init__ at startup
+                batch_type = obj.get_batch_type()
+                if batch_type:
+                    self.register(batch_type, obj)
                     count += 1
 
         return count
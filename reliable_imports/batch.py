@@ -8,16 +8,28 @@ This is the main entry point for the framework, providing methods to:
 - Query batch status
 """
 
+import asyncio
+import csv
+import io
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import register_adapter
+from psycopg2.extras import RealDictCursor, UUID_adapter, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 from .context import ImportContext
 from .exceptions import BatchNotFoundError, ProcessorNotFoundError, ProcessingError
+from .ids import uuid4_strings
+from .jsonb import Json, dumps
 from .models import (
     BatchStatus,
     ImportBatch,
@@ -25,9 +37,14 @@ from .models import (
     ItemStatus,
     BatchSummary,
 )
-from .processor import BaseProcessor
+from .processor import BaseProcessor, _implements_async
 from .registry import ProcessorRegistry, get_registry
 
+# Let UUID objects be passed as query parameters directly. Only the adapter is
+# registered, not register_uuid()'s typecaster, so uuid columns are still
+# returned as strings, here and in application queries.
+register_adapter(UUID, UUID_adapter)
+
 
 class BatchManager:
     """
@@ -45,6 +62,10 @@ class BatchManager:
         connection_string: str,
         registry: Optional[ProcessorRegistry] = None,
         logger: Optional[logging.Logger] = None,
+        min_conn: int = 1,
+        max_conn: int = 10,
+        pre_ping: bool = False,
+        copy_threshold: int = 5000,
     ):
         """
         Initialize the batch manager.
@@ -53,14 +74,171 @@ class BatchManager:
             connection_string: PostgreSQL connection string
             registry: Processor registry (uses global if not provided)
             logger: Logger instance
+            min_conn: Connections kept open in the pool
+            max_conn: Maximum concurrent connections; callers wait for a
+                free connection once this many are in use
+            pre_ping: Test pooled connections with `SELECT 1` before
+                handing them out, replacing any the server has dropped.
+                Costs a round-trip per checkout.
+            copy_threshold: Item count from which new batch items are
+                written with COPY instead of multi-row INSERTs
         """
         self.connection_string = connection_string
         self.registry = registry or get_registry()
         self.logger = logger or logging.getLogger(__name__)
+        self.min_conn = min_conn
+        self.max_conn = max_conn
+        self.copy_threshold = copy_threshold
+        self.pre_ping = pre_ping
+        self._processors: Dict[str, BaseProcessor] = {}
+
+        # The pool is opened on first use so constructing a manager never
+        # touches the database.
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._pool_slots = threading.BoundedSemaphore(max_conn)
+
+    def _get_processor(self, batch_type: str) -> BaseProcessor:
+        """
+        Get a processor instance for a batch type.
+
+        A new instance is created for every batch, unless the processor sets
+        `reuse_instance`: then one instance per batch type is created on
+        first use and reused for later batches. It is replaced if a
+        different class is registered.
+
+        Raises:
+            ProcessorNotFoundError: If no processor is registered for batch_type
+        """
+        processor_class = self.registry.get(batch_type)
+        if not processor_class.reuse_instance:
+            return processor_class()
+
+        instance = self._processors.get(batch_type)
+        if type(instance) is not processor_class:
+            instance = self._processors[batch_type] = processor_class()
+        return instance
+
+    @staticmethod
+    def _check_event_loop(processor: BaseProcessor):
+        """
+        Make sure an async processor's coroutines can be run from this thread.
+
+        process_item_async() runs on an event loop the batch owns, which
+        cannot be started from a thread whose own loop is running, such as
+        an async route handler or a notebook.
+
+        Raises:
+            ProcessingError: If the processor is async and a loop is running
+        """
+        if not _implements_async(type(processor)):
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise ProcessingError(
+            f"{type(processor).__name__} implements process_item_async(), so its "
+            "batches cannot be processed from a running event loop; call "
+            "the BatchManager from a thread instead, e.g. with asyncio.to_thread()"
+        )
+
+    def clear_processor_cache(self):
+        """Drop cached `reuse_instance` processors so they are recreated on next use."""
+        self._processors.clear()
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Get the connection pool, creating it on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        self.min_conn, self.max_conn, self.connection_string
+                    )
+        return self._pool
+
+    @contextmanager
+    def _get_connection(
+        self, slot_reserved: bool = False
+    ) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Borrow a pooled database connection for the duration of a block.
+
+        The transaction is committed when the block exits normally and rolled
+        back if it raises; the connection is then returned to the pool.
+
+        Args:
+            slot_reserved: The caller already holds a pool slot taken with
+                `_reserve_slots()`, so none is acquired here
+        """
+        pool = self._get_pool()
+        if not slot_reserved:
+            self._pool_slots.acquire()
+        try:
+            conn = pool.getconn()
+            if conn.closed or (self.pre_ping and not self._ping(conn)):
+                # Stale connection: discard it and open a fresh one
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            if not slot_reserved:
+                self._pool_slots.release()
+
+    def _reserve_slots(self, count: int) -> int:
+        """
+        Take up to `count` pool slots without waiting for any.
+
+        Used by callers that already hold a connection and want more: waiting
+        for a slot while holding one deadlocks once every connection is held
+        by such a caller. Release the slots with `_release_slots()`.
+
+        Returns:
+            The number of slots taken, possibly 0
+        """
+        reserved = 0
+        while reserved < count and self._pool_slots.acquire(blocking=False):
+            reserved += 1
+        return reserved
+
+    def _release_slots(self, count: int):
+        """Give back slots taken with `_reserve_slots()`."""
+        for _ in range(count):
+            self._pool_slots.release()
+
+    @staticmethod
+    def _ping(conn) -> bool:
+        """Check that a pooled connection still reaches the server."""
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
 
-    def _get_connection(self):
-        """Create a new database connection."""
-        return psycopg2.connect(self.connection_string)
+    def close(self):
+        """
+        Close all pooled database connections.
+
+        Called automatically when the manager is used as a context manager
+        (`with BatchManager(...) as manager:`). A later call that needs the
+        database opens a new pool.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
+    def __enter__(self) -> "BatchManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def create_batch(
         self,
@@ -92,51 +270,209 @@ class BatchManager:
 
         batch_id = uuid4()
 
+        with self._get_connection() as conn:
+            self._insert_batch(conn, batch_id, batch_type, items, source_info, metadata)
+            conn.commit()
+
+        self.logger.info(
+            f"Created batch {batch_id} with {len(items)} items (type: {batch_type})"
+        )
+
+        return batch_id
+
+    def create_batches(self, batches: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        Create several batches in one transaction.
+
+        The batch rows and all of their items are written with one
+        multi-row INSERT per table, so many small batches cost about as much
+        as one large one.
+
+        Args:
+            batches: One dict of `create_batch()` keyword arguments per batch
+                (batch_type, items, and optionally source_info and metadata)
+
+        Returns:
+            The batch IDs, in the same order as `batches`
+
+        Raises:
+            ProcessorNotFoundError: If any batch_type has no registered processor
+        """
+        for batch in batches:
+            if not self.registry.has(batch["batch_type"]):
+                raise ProcessorNotFoundError(
+                    f"No processor registered for batch type: {batch['batch_type']}"
+                )
+
+        batch_ids = [uuid4() for _ in batches]
+        batch_rows = []
+        item_rows = []
+        for batch_id, batch in zip(batch_ids, batches):
+            batch_rows.append(
+                (
+                    batch_id,
+                    batch["batch_type"],
+                    BatchStatus.PENDING.value,
+                    Json(batch.get("source_info") or {}),
+                    Json(batch.get("metadata") or {}),
+                )
+            )
+            item_rows.extend(self._item_rows(batch_id, batch["items"]))
+
         with self._get_connection() as conn:
             with conn.cursor() as cur:
-                # Create batch
-                cur.execute(
+                execute_values(
+                    cur,
                     """
                     INSERT INTO import_batches
                         (id, batch_type, status, source_info, metadata)
-                    VALUES (%s, %s, %s, %s, %s)
+                    VALUES %s
                     """,
-                    (
-                        str(batch_id),
-                        batch_type,
-                        BatchStatus.PENDING.value,
-                        psycopg2.extras.Json(source_info or {}),
-                        psycopg2.extras.Json(metadata or {}),
-                    ),
+                    batch_rows,
                 )
-
-                # Create batch items
-                for idx, item_data in enumerate(items):
-                    cur.execute(
-                        """
-                        INSERT INTO import_batch_items
-                            (id, batch_id, item_index, status, source_data)
-                        VALUES (%s, %s, %s, %s, %s)
-                        """,
-                        (
-                            str(uuid4()),
-                            str(batch_id),
-                            idx,
-                            ItemStatus.PENDING.value,
-                            psycopg2.extras.Json(item_data),
-                        ),
-                    )
-
-                conn.commit()
+                self._insert_items(cur, item_rows)
+            conn.commit()
 
         self.logger.info(
-            f"Created batch {batch_id} with {len(items)} items (type: {batch_type})"
+            f"Created {len(batch_ids)} batches with {len(item_rows)} items"
         )
 
-        return batch_id
+        return batch_ids
+
+    def create_and_process(
+        self,
+        batch_type: str,
+        items: List[Dict[str, Any]],
+        source_info: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        continue_on_error: bool = True,
+        workers: int = 1,
+    ) -> Tuple[UUID, BatchSummary]:
+        """
+        Create a batch and process it straight away on the same connection.
+
+        Equivalent to `create_batch()` followed by `process_batch()`, but the
+        inserts and the switch to PROCESSING are committed together and
+        processing continues on the connection that created the batch.
+
+        Args:
+            batch_type: Type of batch (must have a registered processor)
+            items: List of source data items to process
+            source_info: Metadata about the data source
+            metadata: Additional batch metadata
+            continue_on_error: Whether to continue processing if an item fails
+            workers: Number of connections to process items on in parallel
+
+        Returns:
+            Tuple of (batch ID, batch summary)
+
+        Raises:
+            ProcessorNotFoundError: If no processor is registered for batch_type
+        """
+        processor = self._get_processor(batch_type)
+        self._check_event_loop(processor)
+        batch_id = uuid4()
+
+        with self._get_connection() as conn:
+            self._insert_batch(conn, batch_id, batch_type, items, source_info, metadata)
+            self._update_batch_status(conn, batch_id, BatchStatus.PROCESSING)
+            # Commit before processing so a failed batch can still be marked
+            # FAILED after processing rolls back
+            conn.commit()
+
+            self.logger.info(
+                f"Created batch {batch_id} with {len(items)} items (type: {batch_type})"
+            )
+
+            batch = self._load_batch(conn, batch_id)
+            batch.started_at = datetime.utcnow()
+            self._run_batch(conn, batch, processor, continue_on_error, workers)
+
+        return batch_id, self.get_batch_summary(batch_id)
+
+    def _insert_batch(
+        self,
+        conn,
+        batch_id: UUID,
+        batch_type: str,
+        items: List[Dict[str, Any]],
+        source_info: Optional[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]],
+    ):
+        """Insert a PENDING batch and its items, without committing."""
+        with conn.cursor() as cur:
+            # Create batch
+            cur.execute(
+                """
+                INSERT INTO import_batches
+                    (id, batch_type, status, source_info, metadata)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                (
+                    batch_id,
+                    batch_type,
+                    BatchStatus.PENDING.value,
+                    Json(source_info or {}),
+                    Json(metadata or {}),
+                ),
+            )
+
+            # Create batch items
+            self._insert_items(cur, self._item_rows(batch_id, items))
+
+    @staticmethod
+    def _item_rows(batch_id: UUID, items: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Build PENDING import_batch_items rows for `_insert_items()`.
+
+        source_data is left as the item itself; `_insert_items()` encodes it
+        to suit the insert method.
+        """
+        item_ids = uuid4_strings(len(items))
+        batch_id = str(batch_id)
+        status = ItemStatus.PENDING.value
+        return [
+            (item_ids[idx], batch_id, idx, status, item_data)
+            for idx, item_data in enumerate(items)
+        ]
+
+    def _insert_items(self, cur, rows: List[tuple]):
+        """
+        Insert item rows built by `_item_rows()`.
+
+        Up to `copy_threshold` rows go in multi-row INSERTs of 1000 rows
+        each; larger sets are streamed with COPY, which Postgres ingests
+        several times faster.
+        """
+        if len(rows) >= self.copy_threshold:
+            stream = io.StringIO()
+            writer = csv.writer(stream)
+            for item_id, batch_id, idx, status, item_data in rows:
+                writer.writerow((item_id, batch_id, idx, status, dumps(item_data)))
+            stream.seek(0)
+            cur.copy_expert(
+                """
+                COPY import_batch_items
+                    (id, batch_id, item_index, status, source_data)
+                FROM STDIN WITH (FORMAT CSV)
+                """,
+                stream,
+            )
+            return
+
+        execute_values(
+            cur,
+            """
+            INSERT INTO import_batch_items
+                (id, batch_id, item_index, status, source_data)
+            VALUES %s
+            """,
+            [row[:4] + (Json(row[4]),) for row in rows],
+            page_size=1000,
+        )
 
     def process_batch(
-        self, batch_id: UUID, continue_on_error: bool = True
+        self, batch_id: UUID, continue_on_error: bool = True, workers: int = 1
     ) -> BatchSummary:
         """
         Process a batch.
@@ -144,13 +480,20 @@ class BatchManager:
         This method:
         1. Loads the batch and its items
         2. Instantiates the appropriate processor
-        3. Processes each item in a transaction
+        3. Validates and processes items in chunks of `processor.chunk_size`,
+           one transaction per chunk
         4. Updates batch status
         5. Returns a summary
 
         Args:
             batch_id: The batch to process
             continue_on_error: Whether to continue processing if an item fails
+            workers: Number of connections to process items on in parallel.
+                Items are sharded by `processor.get_shard_key()`; capped at
+                `max_conn - 1` since the batch itself holds one connection,
+                and at the pool connections free when processing starts
+                (the batch never waits for more). Ignored for processors
+                with `requires_serial` set.
 
         Returns:
             Batch summary with statistics
@@ -166,110 +509,341 @@ class BatchManager:
                 raise BatchNotFoundError(f"Batch not found: {batch_id}")
 
             # Get processor
-            processor_class = self.registry.get(batch.batch_type)
-            processor = processor_class()
+            processor = self._get_processor(batch.batch_type)
+            self._check_event_loop(processor)
 
             # Update batch status to processing
             self._update_batch_status(conn, batch_id, BatchStatus.PROCESSING)
             batch.status = BatchStatus.PROCESSING
             batch.started_at = datetime.utcnow()
 
-            # Create context
-            ctx = ImportContext(conn, batch, logger=self.logger)
+            self._run_batch(conn, batch, processor, continue_on_error, workers)
+
+        # Return summary
+        return self.get_batch_summary(batch_id)
+
+    def _run_batch(
+        self,
+        conn,
+        batch: ImportBatch,
+        processor: BaseProcessor,
+        continue_on_error: bool,
+        workers: int,
+    ):
+        """
+        Run a batch already marked PROCESSING through its processor.
+
+        Commits the outcome; on error the batch is marked FAILED and the
+        exception re-raised.
+        """
+        batch_id = batch.id
+        ctx = ImportContext(conn, batch, logger=self.logger)
+
+        try:
+            # Validate batch
+            if not processor.validate_batch(ctx):
+                raise ProcessingError("Batch validation failed")
+
+            # Call on_batch_start hook
+            processor.on_batch_start(ctx)
+
+            # Stream and process items
+            items = self._iter_batch_items(conn, batch_id)
+            workers = 1 if processor.requires_serial else min(workers, self.max_conn - 1)
+            shards = self._reserve_slots(workers) if workers > 1 else 0
+            if shards == 1:
+                # One extra connection would only move the work off this one
+                self._release_slots(shards)
+                shards = 0
+            if workers > 1 and shards < workers:
+                self.logger.info(
+                    f"Processing batch {batch_id} on {max(shards, 1)} of "
+                    f"{workers} connections: the pool has no more free"
+                )
 
             try:
-                # Validate batch
-                if not processor.validate_batch(ctx):
-                    raise ProcessingError("Batch validation failed")
+                if shards:
+                    # Make on_batch_start's work visible to the shard
+                    # connections before they start.
+                    ctx.commit()
+                    success_count, failed_count = self._process_shards(
+                        processor, items, ctx, continue_on_error, shards
+                    )
+                else:
+                    success_count, failed_count = self._process_items(
+                        conn, processor, items, ctx, continue_on_error
+                    )
+            finally:
+                self._release_slots(shards)
+
+            # Determine final batch status
+            if failed_count == 0:
+                final_status = BatchStatus.COMPLETED
+            elif success_count == 0:
+                final_status = BatchStatus.FAILED
+            else:
+                # Partial success - mark as completed
+                final_status = BatchStatus.COMPLETED
 
-                # Call on_batch_start hook
-                processor.on_batch_start(ctx)
+            # Call completion hook
+            processor.on_batch_complete(ctx, final_status == BatchStatus.COMPLETED)
 
-                # Load and process items
-                items = self._load_batch_items(conn, batch_id)
-                success_count = 0
-                failed_count = 0
+            # Update batch status
+            self._update_batch_status(
+                conn, batch_id, final_status, completed_at=datetime.utcnow()
+            )
+
+            ctx.commit()
+
+        except Exception as e:
+            ctx.rollback()
+            self._update_batch_status(
+                conn, batch_id, BatchStatus.FAILED, error_message=str(e)
+            )
+            ctx.commit()
+            raise
+
+        finally:
+            ctx.close()
+
+    def _process_items(
+        self,
+        conn,
+        processor: BaseProcessor,
+        items: Iterable[ImportBatchItem],
+        ctx: ImportContext,
+        continue_on_error: bool,
+        stop: Optional[threading.Event] = None,
+    ) -> Tuple[int, int]:
+        """
+        Process items on one connection in chunks of `processor.chunk_size`.
+
+        The transaction is committed every `processor.commit_every` items;
+        the caller commits whatever is left.
+
+        Args:
+            stop: Checked before each chunk; once set, the remaining items
+                are left pending (another shard of the batch has aborted)
+
+        Returns:
+            Tuple of (succeeded, failed) item counts
+        """
+        success_count = 0
+        failed_count = 0
+        uncommitted = 0
+
+        # Skip items that were already processed. _iter_batch_items() already
+        # leaves them out; this covers items from other sources.
+        pending = (item for item in items if not item.is_complete())
+
+        while True:
+            chunk = list(islice(pending, processor.chunk_size))
+            if not chunk or (stop is not None and stop.is_set()):
+                break
+
+            succeeded, failed = self._process_chunk(
+                conn, processor, chunk, ctx, continue_on_error
+            )
+            success_count += succeeded
+            failed_count += failed
+
+            uncommitted += len(chunk)
+            if uncommitted >= processor.commit_every:
+                ctx.commit()
+                uncommitted = 0
+
+        return success_count, failed_count
+
+    def _process_shards(
+        self,
+        processor: BaseProcessor,
+        items: Iterable[ImportBatchItem],
+        ctx: ImportContext,
+        continue_on_error: bool,
+        workers: int,
+    ) -> Tuple[int, int]:
+        """
+        Process items in parallel, one pooled connection per shard.
+
+        Items are split by `processor.get_shard_key()`, so items that write
+        the same target row always land in the same shard and never contend
+        with each other across connections. They are handed to the shards
+        through bounded queues as `items` is read, so only a few chunks per
+        shard are held in memory at a time.
+
+        If a shard raises (e.g. an item aborts the batch), the other shards
+        stop at their next chunk boundary and no more items are handed out,
+        so the batch stops about where a single connection would have.
+
+        The caller must hold `workers` slots taken with `_reserve_slots()`.
 
+        Returns:
+            Tuple of (succeeded, failed) item counts across all shards
+        """
+        queues: List["queue.Queue[Optional[ImportBatchItem]]"] = [
+            queue.Queue(maxsize=2 * processor.chunk_size) for _ in range(workers)
+        ]
+        stop = threading.Event()
+
+        def run_shard(shard: "queue.Queue[Optional[ImportBatchItem]]") -> Tuple[int, int]:
+            finished = False
+
+            def receive() -> Iterator[ImportBatchItem]:
+                nonlocal finished
+                for item in iter(shard.get, None):
+                    yield item
+                finished = True
+
+            try:
+                with self._get_connection(slot_reserved=True) as shard_conn, ImportContext(
+                    shard_conn, ctx.batch, logger=self.logger
+                ) as shard_ctx:
+                    for key, value in ctx.get_all_metadata().items():
+                        shard_ctx.set_metadata(key, value)
+                    counts = self._process_items(
+                        shard_conn,
+                        processor,
+                        receive(),
+                        shard_ctx,
+                        continue_on_error,
+                        stop,
+                    )
+                    shard_ctx.commit()
+                    return counts
+            except Exception:
+                stop.set()
+                raise
+            finally:
+                # A failed shard keeps taking its items (leaving them
+                # pending) so the queue never blocks the other shards
+                while not finished:
+                    finished = shard.get() is None
+
+        success_count = 0
+        failed_count = 0
+        error: Optional[Exception] = None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_shard, shard) for shard in queues]
+            try:
                 for item in items:
-                    try:
-                        # Update item context
-                        ctx.item = item
-
-                        # Skip if already processed
-                        if item.is_complete():
-                            continue
-
-                        # Check if should skip
-                        if processor.should_skip_item(item, ctx):
-                            self._update_item_status(
-                                conn, item.id, ItemStatus.SKIPPED
-                            )
-                            continue
-
-                        # Validate item
-                        if not processor.validate_item(item, ctx):
-                            self._update_item_status(
-                                conn, item.id, ItemStatus.SKIPPED
-                            )
-                            ctx.warning(f"Item {item.item_index} failed validation")
-                            continue
-
-                        # Process item
-                        self._update_item_status(conn, item.id, ItemStatus.PROCESSING)
-
-                        result = processor.process_item(item, ctx)
-
-                        # Update item with results
-                        self._complete_item(conn, item.id, result)
-                        success_count += 1
-
-                        conn.commit()
-
-                    except Exception as e:
-                        conn.rollback()
-                        failed_count += 1
-
-                        # Update item status
-                        self._fail_item(conn, item.id, str(e))
-                        conn.commit()
-
-                        # Call error hook
-                        should_continue = processor.on_item_error(item, e, ctx)
-
-                        if not should_continue and not continue_on_error:
-                            raise ProcessingError(
-                                f"Batch processing aborted at item {item.item_index}: {e}"
-                            )
-
-                # Determine final batch status
-                if failed_count == 0:
-                    final_status = BatchStatus.COMPLETED
-                elif success_count == 0:
-                    final_status = BatchStatus.FAILED
+                    if stop.is_set():
+                        break
+                    queues[hash(processor.get_shard_key(item)) % workers].put(item)
+            finally:
+                for shard in queues:
+                    shard.put(None)
+
+            for future in futures:
+                try:
+                    succeeded, failed = future.result()
+                except Exception as e:
+                    # Let the remaining shards finish before re-raising
+                    error = error or e
+                    continue
+                success_count += succeeded
+                failed_count += failed
+
+        if error is not None:
+            raise error
+
+        return success_count, failed_count
+
+    def _process_chunk(
+        self,
+        conn,
+        processor: BaseProcessor,
+        chunk: List[ImportBatchItem],
+        ctx: ImportContext,
+        continue_on_error: bool,
+    ) -> Tuple[int, int]:
+        """
+        Validate and process a chunk of items under a savepoint.
+
+        If the chunk fails, it is rolled back to the savepoint and each item
+        is retried on its own, so a single bad item only fails itself.
+
+        Returns:
+            Tuple of (succeeded, failed) item counts
+        """
+        ctx.savepoint()
+
+        try:
+            skipped = []
+            work = []
+            for item in chunk:
+                ctx.item = item
+                if processor.should_skip_item(item, ctx):
+                    skipped.append(item.id)
                 else:
-                    # Partial success - mark as completed
-                    final_status = BatchStatus.COMPLETED
+                    work.append(item)
+
+            # Items go straight from PENDING to their final status: a
+            # PROCESSING write in the same transaction is never visible to
+            # anyone else.
+            results = processor.validate_and_process_items(work, ctx) if work else []
+
+            # Update items with results
+            completed = []
+            for item, result in zip(work, results):
+                if result is None:
+                    skipped.append(item.id)
+                    ctx.item = item
+                    ctx.warning(f"Item {item.item_index} failed validation")
+                else:
+                    completed.append((item.id, result))
 
-                # Call completion hook
-                processor.on_batch_complete(ctx, final_status == BatchStatus.COMPLETED)
+            # Write the chunk's staged target rows inside its savepoint, so
+            # a failing write is retried item by item
+            ctx.flush_staged()
+            self._update_items_status(ctx.cursor, skipped, ItemStatus.SKIPPED)
+            self._complete_items(ctx.cursor, completed)
 
-                # Update batch status
-                self._update_batch_status(
-                    conn, batch_id, final_status, completed_at=datetime.utcnow()
-                )
+            ctx.release_savepoint()
+            return len(completed), 0
 
-                conn.commit()
+        except Exception as e:
+            ctx.rollback_to_savepoint()
 
-            except Exception as e:
-                conn.rollback()
-                self._update_batch_status(
-                    conn, batch_id, BatchStatus.FAILED, error_message=str(e)
-                )
-                conn.commit()
-                raise
+            if len(chunk) > 1:
+                success_count = 0
+                failed_count = 0
+                for item in chunk:
+                    succeeded, failed = self._process_chunk(
+                        conn, processor, [item], ctx, continue_on_error
+                    )
+                    success_count += succeeded
+                    failed_count += failed
+                return success_count, failed_count
 
-            # Return summary
-            return self.get_batch_summary(batch_id)
+            self._handle_item_error(
+                conn, processor, chunk[0], e, ctx, continue_on_error
+            )
+            return 0, 1
+
+    def _handle_item_error(
+        self,
+        conn,
+        processor: BaseProcessor,
+        item: ImportBatchItem,
+        error: Exception,
+        ctx: ImportContext,
+        continue_on_error: bool,
+    ):
+        """Mark an item as failed and let the processor decide whether to abort."""
+        ctx.item = item
+
+        # Update item status
+        self._fail_item(ctx.cursor, item.id, str(error))
+        ctx.commit()
+
+        # Call error hook
+        should_continue = processor.on_item_error(item, error, ctx)
+
+        if not should_continue and not continue_on_error:
+            raise ProcessingError(
+                f"Batch processing aborted at item {item.item_index}: {error}"
+            )
 
     def reprocess_batch(
         self,
@@ -294,66 +868,61 @@ class BatchManager:
         Raises:
             BatchNotFoundError: If the original batch doesn't exist
         """
-        with self._get_connection() as conn:
-            # Load original batch
-            original_batch = self._load_batch(conn, batch_id)
-            if not original_batch:
-                raise BatchNotFoundError(f"Batch not found: {batch_id}")
-
-            # Load items to reprocess
-            if failed_items_only:
-                items = self._load_batch_items(
-                    conn, batch_id, status_filter=ItemStatus.FAILED
-                )
-            else:
-                items = self._load_batch_items(conn, batch_id)
-
-            if not items:
-                self.logger.info(f"No items to reprocess for batch {batch_id}")
-                return batch_id
-
-            # Create new batch with same source data
-            new_batch_id = uuid4()
+        # Create new batch with same source data
+        new_batch_id = uuid4()
 
+        with self._get_connection() as conn:
             with conn.cursor() as cur:
+                # Copy source_info and metadata server-side rather than
+                # re-encoding the JSONB values
                 cur.execute(
                     """
                     INSERT INTO import_batches
                         (id, batch_type, status, source_info, metadata, parent_batch_id)
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    SELECT %s, batch_type, %s,
+                           COALESCE(source_info, '{}'::jsonb),
+                           COALESCE(metadata, '{}'::jsonb),
+                           id
+                    FROM import_batches
+                    WHERE id = %s
                     """,
                     (
-                        str(new_batch_id),
-                        original_batch.batch_type,
+                        new_batch_id,
                         BatchStatus.PENDING.value,
-                        psycopg2.extras.Json(original_batch.source_info or {}),
-                        psycopg2.extras.Json(original_batch.metadata or {}),
-                        str(batch_id),
+                        batch_id,
                     ),
                 )
+                if cur.rowcount == 0:
+                    conn.rollback()
+                    raise BatchNotFoundError(f"Batch not found: {batch_id}")
 
-                # Copy items
-                for idx, item in enumerate(items):
-                    cur.execute(
-                        """
-                        INSERT INTO import_batch_items
-                            (id, batch_id, item_index, status, source_data)
-                        VALUES (%s, %s, %s, %s, %s)
-                        """,
-                        (
-                            str(uuid4()),
-                            str(new_batch_id),
-                            idx,
-                            ItemStatus.PENDING.value,
-                            psycopg2.extras.Json(item.source_data),
-                        ),
-                    )
+                # Copy items server-side too: source_data never leaves the
+                # database, and item ids come from the column default
+                status_clause = "AND status = %s" if failed_items_only else ""
+                cur.execute(
+                    f"""
+                    INSERT INTO import_batch_items
+                        (batch_id, item_index, status, source_data)
+                    SELECT %s, ROW_NUMBER() OVER (ORDER BY item_index) - 1,
+                           %s, source_data
+                    FROM import_batch_items
+                    WHERE batch_id = %s {status_clause}
+                    """,
+                    (new_batch_id, ItemStatus.PENDING.value, batch_id)
+                    + ((ItemStatus.FAILED.value,) if failed_items_only else ()),
+                )
+                item_count = cur.rowcount
+
+                if item_count == 0:
+                    conn.rollback()
+                    self.logger.info(f"No items to reprocess for batch {batch_id}")
+                    return batch_id
 
                 conn.commit()
 
             self.logger.info(
                 f"Created reprocess batch {new_batch_id} "
-                f"from {batch_id} with {len(items)} items"
+                f"from {batch_id} with {item_count} items"
             )
 
         # Process the new batch
@@ -367,7 +936,7 @@ class BatchManager:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(
                     "SELECT * FROM import_batch_summary WHERE id = %s",
-                    (str(batch_id),),
+                    (batch_id,),
                 )
                 row = cur.fetchone()
 
@@ -389,11 +958,31 @@ class BatchManager:
                     duration_seconds=row["duration_seconds"],
                 )
 
+    def get_batch_type(self, batch_id: UUID) -> str:
+        """
+        Get a batch's type without computing its item statistics.
+
+        Raises:
+            BatchNotFoundError: If the batch doesn't exist
+        """
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT batch_type FROM import_batches WHERE id = %s",
+                    (batch_id,),
+                )
+                row = cur.fetchone()
+
+        if not row:
+            raise BatchNotFoundError(f"Batch not found: {batch_id}")
+
+        return row[0]
+
     def _load_batch(self, conn, batch_id: UUID) -> Optional[ImportBatch]:
         """Load a batch from the database."""
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
-                "SELECT * FROM import_batches WHERE id = %s", (str(batch_id),)
+                "SELECT * FROM import_batches WHERE id = %s", (batch_id,)
             )
             row = cur.fetchone()
 
@@ -417,52 +1006,73 @@ class BatchManager:
                 metadata=row["metadata"] or {},
             )
 
-    def _load_batch_items(
+    def _iter_batch_items(
         self,
         conn,
         batch_id: UUID,
-        status_filter: Optional[ItemStatus] = None,
-    ) -> List[ImportBatchItem]:
-        """Load batch items from the database."""
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            if status_filter:
-                cur.execute(
-                    """
-                    SELECT * FROM import_batch_items
-                    WHERE batch_id = %s AND status = %s
-                    ORDER BY item_index
-                    """,
-                    (str(batch_id), status_filter.value),
-                )
-            else:
+        page_size: int = 1000,
+        skip_complete: bool = True,
+    ) -> Iterator[ImportBatchItem]:
+        """
+        Yield a batch's items in item_index order, `page_size` rows at a time.
+
+        Pages are fetched by item_index (keyset pagination) rather than
+        through a server-side cursor, which would not survive the commits
+        and rollbacks made while the items are processed.
+
+        With `skip_complete`, items already in a final status (see
+        ImportBatchItem.is_complete()) are filtered out in the query, so
+        resuming a batch does not fetch the rows it has already finished.
+        """
+        status_clause = ""
+        status_params: tuple = ()
+        if skip_complete:
+            status_clause = "AND status NOT IN %s"
+            status_params = (
+                (
+                    ItemStatus.COMPLETED.value,
+                    ItemStatus.FAILED.value,
+                    ItemStatus.SKIPPED.value,
+                ),
+            )
+
+        last_index = -1
+        while True:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(
-                    """
+                    f"""
                     SELECT * FROM import_batch_items
-                    WHERE batch_id = %s
+                    WHERE batch_id = %s AND item_index > %s {status_clause}
                     ORDER BY item_index
+                    LIMIT %s
                     """,
-                    (str(batch_id),),
+                    (batch_id, last_index, *status_params, page_size),
                 )
-
-            items = []
-            for row in cur.fetchall():
-                items.append(
-                    ImportBatchItem(
-                        id=UUID(row["id"]),
-                        batch_id=UUID(row["batch_id"]),
-                        item_index=row["item_index"],
-                        status=ItemStatus(row["status"]),
-                        source_data=row["source_data"],
-                        processed_data=row["processed_data"],
-                        target_table=row["target_table"],
-                        target_id=UUID(row["target_id"]) if row["target_id"] else None,
-                        error_message=row["error_message"],
-                        processed_at=row["processed_at"],
-                        created_at=row["created_at"],
-                    )
-                )
-
-            return items
+                rows = cur.fetchall()
+
+            for row in rows:
+                yield self._item_from_row(row)
+
+            if len(rows) < page_size:
+                return
+            last_index = rows[-1]["item_index"]
+
+    @staticmethod
+    def _item_from_row(row: Dict[str, Any]) -> ImportBatchItem:
+        """Build an ImportBatchItem from an import_batch_items row."""
+        return ImportBatchItem(
+            id=UUID(row["id"]),
+            batch_id=UUID(row["batch_id"]),
+            item_index=row["item_index"],
+            status=ItemStatus(row["status"]),
+            source_data=row["source_data"],
+            processed_data=row["processed_data"],
+            target_table=row["target_table"],
+            target_id=UUID(row["target_id"]) if row["target_id"] else None,
+            error_message=row["error_message"],
+            processed_at=row["processed_at"],
+            created_at=row["created_at"],
+        )
 
     def _update_batch_status(
         self,
@@ -483,52 +1093,63 @@ class BatchManager:
                     updated_at = NOW()
                 WHERE id = %s
                 """,
-                (status.value, error_message, completed_at, str(batch_id)),
+                (status.value, error_message, completed_at, batch_id),
             )
 
-    def _update_item_status(self, conn, item_id: UUID, status: ItemStatus):
-        """Update item status."""
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE import_batch_items
-                SET status = %s
-                WHERE id = %s
-                """,
-                (status.value, str(item_id)),
-            )
+    def _update_items_status(self, cur, item_ids: List[UUID], status: ItemStatus):
+        """Update the status of several items with a single statement."""
+        if not item_ids:
+            return
+        cur.execute(
+            """
+            UPDATE import_batch_items
+            SET status = %s
+            WHERE id = ANY(%s::uuid[])
+            """,
+            (status.value, list(item_ids)),
+        )
 
-    def _complete_item(self, conn, item_id: UUID, result: Dict[str, Any]):
-        """Mark item as completed with results."""
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE import_batch_items
-                SET status = %s,
-                    processed_data = %s,
-                    target_table = %s,
-                    target_id = %s,
-                    processed_at = NOW()
-                WHERE id = %s
-                """,
+    def _complete_items(self, cur, completed: List[Tuple[UUID, Dict[str, Any]]]):
+        """
+        Mark items as completed with their results.
+
+        All rows are updated by a single UPDATE ... FROM (VALUES ...) per
+        1000 items rather than one statement per item.
+        """
+        if not completed:
+            return
+        execute_values(
+            cur,
+            f"""
+            UPDATE import_batch_items AS t
+            SET status = '{ItemStatus.COMPLETED.value}',
+                processed_data = v.processed_data::jsonb,
+                target_table = v.target_table,
+                target_id = v.target_id::uuid,
+                processed_at = NOW()
+            FROM (VALUES %s) AS v(id, processed_data, target_table, target_id)
+            WHERE t.id = v.id::uuid
+            """,
+            [
                 (
-                    ItemStatus.COMPLETED.value,
-                    psycopg2.extras.Json(result.get("processed_data")),
+                    item_id,
+                    Json(result.get("processed_data")),
                     result.get("target_table"),
                     str(result["target_id"]) if result.get("target_id") else None,
-                    str(item_id),
-                ),
-            )
+                )
+                for item_id, result in completed
+            ],
+            page_size=1000,
+        )
 
-    def _fail_item(self, conn, item_id: UUID, error_message: str):
+    def _fail_item(self, cur, item_id: UUID, error_message: str):
         """Mark item as failed."""
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE import_batch_items
-                SET status = %s,
-                    error_message = %s
-                WHERE id = %s
-                """,
-                (ItemStatus.FAILED.value, error_message, str(item_id)),
-            )
+        cur.execute(
+            """
+            UPDATE import_batch_items
+            SET status = %s,
+                error_message = %s
+            WHERE id = %s
+            """,
+            (ItemStatus.FAILED.value, error_message, item_id),
+        )
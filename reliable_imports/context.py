@@ -2,15 +2,23 @@
 Import context provides the processing environment for batch operations.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
+from .jsonb import Json
 from .models import ImportBatch, ImportBatchItem
 
+# Shared, read-only `extra` for log records without details
+_NO_EXTRA = MappingProxyType({})
+
+T = TypeVar("T")
+
 
 class ImportContext:
     """
@@ -18,7 +26,7 @@ class ImportContext:
 
     The context encapsulates:
     - Database connection for transactional operations
-    - Logging facility tied to the batch
+    - Logging facility tied to the batch, buffered and written in bulk
     - Access to batch and item metadata
     - Helper methods for common operations
 
@@ -26,6 +34,9 @@ class ImportContext:
     data operations within a batch.
     """
 
+    # Staged rows (see stage()) are written once this many are queued
+    stage_flush_size: int = 1000
+
     def __init__(
         self,
         conn: psycopg2.extensions.connection,
@@ -37,35 +48,112 @@ class ImportContext:
         self.batch = batch
         self.item = item
         self.logger = logger or logging.getLogger(__name__)
+        self._log_methods = {
+            "debug": self.logger.debug,
+            "info": self.logger.info,
+            "warning": self.logger.warning,
+            "error": self.logger.error,
+        }
         self._metadata: Dict[str, Any] = {}
+        self._log_buffer: List[Tuple[Any, ...]] = []
+        self._log_mark = 0
+        self._staged: Dict[str, List[tuple]] = {}
+        self._staged_count = 0
+        self._cursor: Optional[psycopg2.extensions.cursor] = None
+        self._dict_cursor: Optional[RealDictCursor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def cursor(self) -> psycopg2.extensions.cursor:
+        """
+        Cursor on the context's connection, opened on first use.
+
+        The context and the BatchManager reuse it for their own statements
+        instead of opening a cursor per call; it is closed by close().
+        """
+        if self._cursor is None or self._cursor.closed:
+            self._cursor = self.conn.cursor()
+        return self._cursor
+
+    @property
+    def dict_cursor(self) -> RealDictCursor:
+        """RealDictCursor counterpart of `cursor`, used by execute()."""
+        if self._dict_cursor is None or self._dict_cursor.closed:
+            self._dict_cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        return self._dict_cursor
+
+    def run_async(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine to completion on the context's event loop.
+
+        The loop is created on first use and kept until close(), so clients
+        and sessions a processor opens on it stay usable from one chunk to
+        the next. Each context belongs to one thread, so shards processed in
+        parallel each get their own loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """
+        Close the cursors and event loop opened by the context.
+
+        The connection stays open.
+        """
+        for cur in (self._cursor, self._dict_cursor):
+            if cur is not None:
+                cur.close()
+        self._cursor = None
+        self._dict_cursor = None
+
+        if self._loop is not None:
+            try:
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            finally:
+                self._loop.close()
+                self._loop = None
+
+    def __enter__(self) -> "ImportContext":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def log(self, level: str, message: str, details: Optional[Dict[str, Any]] = None):
         """
         Log a message associated with the current batch/item.
 
+        The database row is buffered and written by flush_logs(), which
+        commit() calls, so logging inside the item loop does not cost a
+        round-trip per message.
+
         Args:
             level: Log level (debug, info, warning, error)
             message: Log message
             details: Optional structured details
         """
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO import_logs (batch_id, item_id, log_level, message, details)
-                VALUES (%s, %s, %s, %s, %s)
-                """,
-                (
-                    str(self.batch.id),
-                    str(self.item.id) if self.item else None,
-                    level,
-                    message,
-                    psycopg2.extras.Json(details) if details else None,
-                ),
+        self._log_buffer.append(
+            (
+                str(self.batch.id),
+                str(self.item.id) if self.item else None,
+                level,
+                message,
+                Json(details) if details else None,
             )
+        )
 
         # Also log to Python logger
-        log_method = getattr(self.logger, level.lower(), self.logger.info)
-        log_method(f"[{self.batch.batch_type}] {message}", extra=details or {})
+        log_method = self._log_methods.get(level)
+        if log_method is None:
+            log_method = getattr(self.logger, level.lower(), self.logger.info)
+        log_method(f"[{self.batch.batch_type}] {message}", extra=details or _NO_EXTRA)
 
     def info(self, message: str, details: Optional[Dict[str, Any]] = None):
         """Log an info message."""
@@ -83,6 +171,114 @@ class ImportContext:
         """Log a debug message."""
         self.log("debug", message, details)
 
+    def flush_logs(self):
+        """Write buffered log messages to import_logs in one statement."""
+        if not self._log_buffer:
+            return
+
+        execute_values(
+            self.cursor,
+            """
+            INSERT INTO import_logs (batch_id, item_id, log_level, message, details)
+            VALUES %s
+            """,
+            self._log_buffer,
+            page_size=1000,
+        )
+        self._log_buffer = []
+
+    def stage(self, query: str, row: tuple):
+        """
+        Queue one row for a multi-row write instead of executing it now.
+
+        Rows staged with the same query are written together by
+        flush_staged(), one execute_values() call per query, so a processor
+        can persist each item's target row without a round-trip per item.
+        The framework flushes at the end of every chunk, inside the chunk's
+        savepoint, so a failing write is retried item by item like any other
+        processing error.
+
+        Staged writes run later than the call, so nothing can be read back
+        from them within the same item: generate ids client-side rather than
+        relying on RETURNING.
+
+        Args:
+            query: Statement with a single `VALUES %s` placeholder, e.g.
+                "INSERT INTO customers (id, email) VALUES %s"
+            row: Values for one row of that statement
+
+        Example:
+            >>> def process_item(self, item, ctx):
+            ...     customer_id = uuid4()
+            ...     ctx.stage(
+            ...         "INSERT INTO customers (id, email) VALUES %s",
+            ...         (customer_id, item.source_data['email']),
+            ...     )
+            ...     return {'target_table': 'customers', 'target_id': customer_id}
+        """
+        self._staged.setdefault(query, []).append(row)
+        self._staged_count += 1
+        if self._staged_count >= self.stage_flush_size:
+            self.flush_staged()
+
+    def flush_staged(self):
+        """Write rows queued by stage(), one execute_values() call per query."""
+        if not self._staged:
+            return
+
+        staged = self._staged
+        self._staged = {}
+        self._staged_count = 0
+        for query, rows in staged.items():
+            execute_values(self.cursor, query, rows, page_size=1000)
+
+    def commit(self):
+        """Flush staged rows and buffered logs, and commit the current transaction."""
+        self.flush_staged()
+        self.flush_logs()
+        self.conn.commit()
+
+    def rollback(self):
+        """
+        Roll back the current transaction.
+
+        Log messages buffered and rows staged since the last commit are
+        discarded with it, just as they would be if they had been written.
+        """
+        self._log_buffer = []
+        self._staged = {}
+        self._staged_count = 0
+        self.conn.rollback()
+
+    def savepoint(self):
+        """
+        Set a savepoint that rollback_to_savepoint() can return to.
+
+        Lets a unit of work (one chunk of items) be undone without losing
+        earlier uncommitted work in the same transaction. Rows staged before
+        the savepoint are written first, so they are not undone with it.
+        """
+        self.flush_staged()
+        self.cursor.execute("SAVEPOINT import_chunk")
+        self._log_mark = len(self._log_buffer)
+
+    def release_savepoint(self):
+        """Keep the work done since savepoint()."""
+        self.cursor.execute("RELEASE SAVEPOINT import_chunk")
+
+    def rollback_to_savepoint(self):
+        """
+        Undo the work done since savepoint(), and release the savepoint.
+
+        Log messages buffered and rows staged since then are discarded with it.
+        """
+        self.cursor.execute(
+            "ROLLBACK TO SAVEPOINT import_chunk; RELEASE SAVEPOINT import_chunk"
+        )
+        del self._log_buffer[self._log_mark:]
+        self._staged = {}
+        self._staged_count = 0
+
     def execute(self, query: str, params: Optional[tuple] = None) -> Any:
         """
         Execute a SQL query and return results.
@@ -94,19 +290,19 @@ class ImportContext:
         Returns:
             Query results
         """
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query, params)
-            if cur.description:
-                return cur.fetchall()
-            return None
+        cur = self.dict_cursor
+        cur.execute(query, params)
+        if cur.description:
+            return cur.fetchall()
+        return None
 
     def execute_one(self, query: str, params: Optional[tuple] = None) -> Optional[Dict]:
         """Execute a query and return the first result."""
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query, params)
-            if cur.description:
-                return cur.fetchone()
-            return None
+        cur = self.dict_cursor
+        cur.execute(query, params)
+        if cur.description:
+            return cur.fetchone()
+        return None
 
     def set_metadata(self, key: str, value: Any):
         """Set a metadata value for the current processing context."""
@@ -5,8 +5,9 @@ This module provides the BaseEndpoint class that allows developers to
 override default API behavior for specific batch types.
 """
 
-from abc import ABC
-from typing import Any, Dict, List, Optional
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from uuid import UUID
 
 from fastapi import Request
@@ -15,6 +16,11 @@ from .api_models import CreateBatchRequest, ProcessBatchRequest, ReprocessBatchR
 from .models import BatchSummary, ImportBatch
 
 
+# Compiled once for _camel_to_snake(), as in processor.py
+_CAMEL_WORD = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY = re.compile(r'([a-z0-9])([A-Z])')
+
+
 class EndpointContext:
     """
     Context object passed to endpoint hooks.
@@ -25,6 +31,8 @@ class EndpointContext:
     - Batch manager instance
     """
 
+    __slots__ = ("request", "batch_manager", "user_id", "_metadata", "_metadata_view")
+
     def __init__(
         self,
         request: Request,
@@ -35,6 +43,7 @@ class EndpointContext:
         self.batch_manager = batch_manager
         self.user_id = user_id
         self._metadata: Dict[str, Any] = {}
+        self._metadata_view = MappingProxyType(self._metadata)
 
     def set_metadata(self, key: str, value: Any):
         """Store custom metadata in the context."""
@@ -45,18 +54,31 @@ class EndpointContext:
         return self._metadata.get(key, default)
 
     @property
-    def metadata(self) -> Dict[str, Any]:
-        """Get all metadata."""
-        return self._metadata.copy()
+    def metadata(self) -> Mapping[str, Any]:
+        """
+        Get all metadata, as a read-only live view.
+
+        Use set_metadata() to change it, or dict(ctx.metadata) for a copy.
+        """
+        return self._metadata_view
 
 
-class BaseEndpoint(ABC):
+class BaseEndpoint:
     """
     Base class for custom endpoint behavior.
 
     Convention: Endpoints should be named like `CustomerDataEndpoint`
     to customize the API for the `customer_data` batch type.
 
+    Hooks may be overridden as plain methods or as `async def` coroutines.
+    The APIManager awaits async hooks on the event loop, so use them for
+    non-blocking I/O such as webhook calls; plain methods run in a worker
+    thread, so blocking calls there do not stall other requests.
+
+    The APIManager creates one instance per batch type and reuses it for
+    every request, so keep per-request state on the EndpointContext rather
+    than on the endpoint.
+
     Example:
         >>> class CustomerDataEndpoint(BaseEndpoint):
         ...     batch_type = 'customer_data'
@@ -72,26 +94,46 @@ class BaseEndpoint(ABC):
         ...         self._send_notification(summary)
     """
 
+    # The base keeps no per-instance state (batch_type is a class attribute),
+    # so it adds no __dict__. Subclasses get one unless they declare their own
+    # __slots__.
+    __slots__ = ()
+
     # Override in subclass to specify the batch type this endpoint handles
     batch_type: Optional[str] = None
 
-    def __init__(self):
-        """Initialize the endpoint."""
-        if not self.batch_type:
-            # Auto-derive batch_type from class name if not specified
+    # True when batch_type was derived from the class name rather than set
+    _batch_type_derived = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Derive batch_type from the class name once, when the subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("batch_type"):
+            cls._batch_type_derived = False
+        elif not cls.batch_type or cls._batch_type_derived:
+            # An explicit batch_type is inherited; a derived one is not.
             # E.g., CustomerDataEndpoint -> customer_data
-            class_name = self.__class__.__name__
+            class_name = cls.__name__
             if class_name.endswith("Endpoint"):
                 class_name = class_name[:-8]  # Remove "Endpoint"
-            # Convert CamelCase to snake_case
-            self.batch_type = self._camel_to_snake(class_name)
+            cls.batch_type = cls._camel_to_snake(class_name)
+            cls._batch_type_derived = True
+
+    @classmethod
+    def get_batch_type(cls) -> str:
+        """
+        Get the batch type this endpoint class handles, without instantiating it.
+
+        Returns:
+            The `batch_type` class attribute, which defaults to a name derived
+            from the class name (CustomerDataEndpoint -> customer_data)
+        """
+        return cls.batch_type
 
     @staticmethod
     def _camel_to_snake(name: str) -> str:
         """Convert CamelCase to snake_case."""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return _CAMEL_BOUNDARY.sub(r'\1_\2', _CAMEL_WORD.sub(r'\1_\2', name)).lower()
 
     # ===== Lifecycle Hooks =====
 
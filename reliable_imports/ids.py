@@ -0,0 +1,33 @@
+"""
+Bulk UUID generation for batch inserts.
+"""
+
+import os
+from typing import List
+
+
+def uuid4_strings(count: int) -> List[str]:
+    """
+    Generate `count` random (version 4) UUIDs as canonical strings.
+
+    Equivalent to `[str(uuid4()) for _ in range(count)]`, but reads all the
+    randomness with a single os.urandom() call and formats the strings
+    directly from its hex digest instead of building a UUID object per id.
+
+    Args:
+        count: Number of UUIDs to generate
+
+    Returns:
+        List of UUID strings, e.g. '9f1c2d3e-4b5a-4c6d-8e7f-0a1b2c3d4e5f'
+    """
+    buf = bytearray(os.urandom(16 * count))
+
+    # Set the version (4) and RFC 4122 variant bits of every UUID at once
+    buf[6::16] = bytes((b & 0x0F) | 0x40 for b in buf[6::16])
+    buf[8::16] = bytes((b & 0x3F) | 0x80 for b in buf[8::16])
+
+    h = buf.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
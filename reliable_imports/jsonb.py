@@ -0,0 +1,36 @@
+"""
+Encoding of JSONB query parameters.
+
+psycopg2's Json adapter serializes with the standard library json module.
+These helpers use orjson instead, which encodes the same values several
+times faster; the server parses the text into JSONB either way.
+"""
+
+import json
+from typing import Any
+
+import orjson
+import psycopg2.extras
+
+
+def dumps(obj: Any) -> str:
+    """
+    Encode a value as JSON text for a JSONB column.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        The JSON text
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson rejects a few values json accepts, e.g. integers wider
+        # than 64 bits
+        return json.dumps(obj)
+
+
+def Json(obj: Any) -> psycopg2.extras.Json:
+    """Wrap a value as a JSONB query parameter encoded with dumps()."""
+    return psycopg2.extras.Json(obj, dumps=dumps)
@@ -2,12 +2,18 @@
 Core data models for the Reliable Imports framework.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+# Items are materialized one per row, so drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+). Instances then only accept their
+# declared fields as attributes.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class BatchStatus(str, Enum):
     """Status values for import batches."""
@@ -27,7 +33,24 @@ class ItemStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Final statuses, for the is_complete() checks. Enum members hash by name, so
+# the plain string values are included for statuses set as strings.
+_BATCH_DONE = frozenset(
+    (BatchStatus.COMPLETED, BatchStatus.FAILED, "completed", "failed")
+)
+_ITEM_DONE = frozenset(
+    (
+        ItemStatus.COMPLETED,
+        ItemStatus.FAILED,
+        ItemStatus.SKIPPED,
+        "completed",
+        "failed",
+        "skipped",
+    )
+)
+
+
+@dataclass(**_SLOTS)
 class ImportBatch:
     """
     Represents an import batch operation.
@@ -50,7 +73,7 @@ class ImportBatch:
 
     def is_complete(self) -> bool:
         """Check if batch has finished processing."""
-        return self.status in (BatchStatus.COMPLETED, BatchStatus.FAILED)
+        return self.status in _BATCH_DONE
 
     def is_successful(self) -> bool:
         """Check if batch completed successfully."""
@@ -61,7 +84,7 @@ class ImportBatch:
         return self.parent_batch_id is not None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImportBatchItem:
     """
     Represents a single item within an import batch.
@@ -83,14 +106,14 @@ class ImportBatchItem:
 
     def is_complete(self) -> bool:
         """Check if item has finished processing."""
-        return self.status in (ItemStatus.COMPLETED, ItemStatus.FAILED, ItemStatus.SKIPPED)
+        return self.status in _ITEM_DONE
 
     def is_successful(self) -> bool:
         """Check if item completed successfully."""
         return self.status == ItemStatus.COMPLETED
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImportLog:
     """Represents a log entry for an import operation."""
     id: int
@@ -102,7 +125,7 @@ class ImportLog:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchSummary:
     """Summary statistics for a batch operation."""
     id: UUID
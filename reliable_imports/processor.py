@@ -2,16 +2,26 @@
 Base processor class for implementing batch processing logic.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from .context import ImportContext
 from .models import ImportBatchItem
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it would load psycopg2
+    from .context import ImportContext
 
-class BaseProcessor(ABC):
+
+# Patterns for _camel_to_snake(): a word starting with a capital, and a
+# lowercase letter or digit followed by a capital
+_CAMEL_WORD = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY = re.compile(r'([a-z0-9])([A-Z])')
+
+
+class BaseProcessor:
     """
-    Abstract base class for batch processors.
+    Base class for batch processors.
 
     Convention: Processors should be named like `CustomerDataProcessor`
     for a batch_type of `customer_data`. The framework will automatically
@@ -19,30 +29,68 @@ class BaseProcessor(ABC):
 
     This convention-based approach saves developer time by eliminating
     boilerplate registration code.
+
+    The BatchManager creates a new instance for every batch, so per-batch
+    state can be kept on the processor (see `reuse_instance` to share one
+    instance instead). With `workers > 1`, the batch's items are processed
+    on that instance from several threads at once.
     """
 
+    # The base keeps no per-instance state (batch_type and the settings below
+    # are class attributes), so it adds no __dict__. Subclasses get one
+    # unless they declare their own __slots__.
+    __slots__ = ()
+
     # Override in subclass to specify the batch type this processor handles
     batch_type: Optional[str] = None
 
-    def __init__(self):
-        """Initialize the processor."""
-        if not self.batch_type:
-            # Auto-derive batch_type from class name if not specified
+    # Number of items handed to validate_and_process_items() at a time. If a
+    # chunk fails, its items are retried one by one. Raise it in processors
+    # that override process_items() with a set-based implementation.
+    chunk_size: int = 1
+
+    # Items to process before committing. Each chunk runs under its own
+    # savepoint, so a failing item never undoes others in the transaction.
+    commit_every: int = 100
+
+    # Set in processors whose items must be handled one after another (e.g.
+    # each item depends on the previous one); process_batch() then ignores
+    # `workers` and processes the batch on a single connection.
+    requires_serial: bool = False
+
+    # Set in processors that keep no per-batch state on self (e.g. ones
+    # that hold an expensive client for their whole life); the BatchManager
+    # then creates one instance and uses it for every batch, possibly from
+    # several threads at once.
+    reuse_instance: bool = False
+
+    # Items of a chunk processed at once by processors that implement
+    # process_item_async(); raise chunk_size to at least this to benefit.
+    max_concurrency: int = 16
+
+    # True when batch_type was derived from the class name rather than set
+    _batch_type_derived = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Derive batch_type from the class name once, when the subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("batch_type"):
+            cls._batch_type_derived = False
+        elif not cls.batch_type or cls._batch_type_derived:
+            # An explicit batch_type is inherited; a derived one is not.
             # E.g., CustomerDataProcessor -> customer_data
-            class_name = self.__class__.__name__
+            class_name = cls.__name__
             if class_name.endswith("Processor"):
                 class_name = class_name[:-9]  # Remove "Processor"
-            # Convert CamelCase to snake_case
-            self.batch_type = self._camel_to_snake(class_name)
+            cls.batch_type = cls._camel_to_snake(class_name)
+            cls._batch_type_derived = True
 
     @staticmethod
     def _camel_to_snake(name: str) -> str:
         """Convert CamelCase to snake_case."""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return _CAMEL_BOUNDARY.sub(r'\1_\2', _CAMEL_WORD.sub(r'\1_\2', name)).lower()
 
-    def validate_batch(self, ctx: ImportContext) -> bool:
+    def validate_batch(self, ctx: "ImportContext") -> bool:
         """
         Validate the entire batch before processing begins.
 
@@ -57,10 +105,9 @@ class BaseProcessor(ABC):
         """
         return True
 
-    @abstractmethod
-    def validate_item(self, item: ImportBatchItem, ctx: ImportContext) -> bool:
+    def validate_item(self, item: ImportBatchItem, ctx: "ImportContext") -> bool:
         """
-        Validate a single item before processing.
+        Validate a single item before processing. Must be implemented.
 
         Args:
             item: The batch item to validate
@@ -69,11 +116,10 @@ class BaseProcessor(ABC):
         Returns:
             True if item is valid, False to skip the item
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement validate_item()")
 
-    @abstractmethod
     def process_item(
-        self, item: ImportBatchItem, ctx: ImportContext
+        self, item: ImportBatchItem, ctx: "ImportContext"
     ) -> Dict[str, Any]:
         """
         Process a single batch item.
@@ -83,6 +129,9 @@ class BaseProcessor(ABC):
         2. Perform any necessary database operations
         3. Return processed data and metadata
 
+        Implement either this or process_item_async(), or override
+        process_items() to handle whole chunks instead.
+
         Args:
             item: The batch item to process
             ctx: Import context with database connection and logging
@@ -94,9 +143,141 @@ class BaseProcessor(ABC):
                 - processed_data: Transformed data (optional)
                 - Any other metadata you want to store
         """
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement process_item() "
+            f"or process_item_async()"
+        )
+
+    async def process_item_async(
+        self, item: ImportBatchItem, ctx: "ImportContext"
+    ) -> Dict[str, Any]:
+        """
+        Process a single batch item as a coroutine.
+
+        Implement this instead of process_item() when item processing mostly
+        waits on I/O (HTTP calls, external services). process_items() then
+        runs up to `max_concurrency` items of a chunk at once on an event
+        loop, so raise `chunk_size` accordingly. The loop is kept for the
+        whole batch, so a client session can be opened once (e.g. in the
+        first call) and reused by later chunks.
+
+        The BatchManager runs the loop itself: call process_batch() from a
+        thread without a running event loop (e.g. through
+        asyncio.to_thread() from async code).
+
+        The items share the context and its connection, and ctx.item is not
+        kept per item across awaits: use `item` rather than ctx.item, and do
+        database work through ctx without awaiting in between, as psycopg2
+        calls block the loop.
+
+        Args:
+            item: The batch item to process
+            ctx: Import context with database connection and logging
+
+        Returns:
+            The result dict, as for process_item()
+        """
+        raise NotImplementedError
 
-    def on_batch_start(self, ctx: ImportContext):
+    async def process_items_async(
+        self, items: List[ImportBatchItem], ctx: "ImportContext"
+    ) -> List[Dict[str, Any]]:
+        """
+        Run process_item_async() over items, at most `max_concurrency` at a time.
+
+        Every item is awaited before returning; if any raised, the first
+        exception (in item order) is re-raised so the chunk is retried item
+        by item.
+
+        Returns:
+            One result dict per item, in the same order as `items`
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(item: ImportBatchItem) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process_item_async(item, ctx)
+
+        results = await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def process_items(
+        self, items: List[ImportBatchItem], ctx: "ImportContext"
+    ) -> List[Dict[str, Any]]:
+        """
+        Process a chunk of validated batch items.
+
+        Override this to handle a whole chunk in a few database round-trips
+        (e.g. a single multi-row INSERT ... ON CONFLICT) instead of one call
+        per item. The chunk is processed in one transaction; if it raises, the
+        BatchManager rolls back and retries each item on its own so that
+        failures are still tracked per item.
+
+        By default, calls process_item() for each item, or, for processors
+        that implement process_item_async(), runs process_items_async() on
+        the context's event loop (see ImportContext.run_async()).
+
+        Args:
+            items: Validated batch items (at most `chunk_size` of them)
+            ctx: Import context with database connection and logging
+
+        Returns:
+            One result dict per item, in the same order as `items`
+            (see process_item() for the result format)
+        """
+        if _implements_async(type(self)):
+            return ctx.run_async(self.process_items_async(items, ctx))
+
+        results = []
+        for item in items:
+            ctx.item = item
+            results.append(self.process_item(item, ctx))
+        return results
+
+    def validate_and_process_items(
+        self, items: List[ImportBatchItem], ctx: "ImportContext"
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Validate and process a chunk of batch items in one pass.
+
+        This is what the BatchManager calls for each chunk. Override it to
+        validate items inline while building the chunk's database writes,
+        instead of walking the items once in validate_item() and again in
+        process_items().
+
+        By default, calls validate_item() for each item and passes the valid
+        ones to process_items().
+
+        Args:
+            items: Batch items to validate and process
+            ctx: Import context with database connection and logging
+
+        Returns:
+            One entry per item, in the same order as `items`: the result dict
+            for processed items, or None for items that failed validation
+            (these are marked as skipped)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+        valid = []
+        for idx, item in enumerate(items):
+            ctx.item = item
+            if self.validate_item(item, ctx):
+                valid.append(idx)
+
+        if valid:
+            processed = self.process_items([items[idx] for idx in valid], ctx)
+            for idx, result in zip(valid, processed):
+                results[idx] = result
+
+        return results
+
+    def on_batch_start(self, ctx: "ImportContext"):
         """
         Hook called when batch processing starts.
 
@@ -110,7 +291,7 @@ class BaseProcessor(ABC):
         """
         pass
 
-    def on_batch_complete(self, ctx: ImportContext, success: bool):
+    def on_batch_complete(self, ctx: "ImportContext", success: bool):
         """
         Hook called when batch processing completes.
 
@@ -126,7 +307,7 @@ class BaseProcessor(ABC):
         pass
 
     def on_item_error(
-        self, item: ImportBatchItem, error: Exception, ctx: ImportContext
+        self, item: ImportBatchItem, error: Exception, ctx: "ImportContext"
     ) -> bool:
         """
         Hook called when an item fails to process.
@@ -144,7 +325,7 @@ class BaseProcessor(ABC):
         ctx.error(f"Error processing item {item.item_index}: {str(error)}")
         return True  # Continue by default
 
-    def get_batch_items(self, ctx: ImportContext) -> List[ImportBatchItem]:
+    def get_batch_items(self, ctx: "ImportContext") -> List[ImportBatchItem]:
         """
         Retrieve items for the current batch.
 
@@ -161,7 +342,7 @@ class BaseProcessor(ABC):
         # Subclasses can override for custom behavior
         pass
 
-    def should_skip_item(self, item: ImportBatchItem, ctx: ImportContext) -> bool:
+    def should_skip_item(self, item: ImportBatchItem, ctx: "ImportContext") -> bool:
         """
         Determine if an item should be skipped.
 
@@ -176,8 +357,24 @@ class BaseProcessor(ABC):
         """
         return False
 
+    def get_shard_key(self, item: ImportBatchItem) -> Any:
+        """
+        Key used to assign an item to a worker when processing in parallel.
+
+        Items with equal keys are always processed on the same connection.
+        Override this to return the target row's natural key (e.g. an email
+        address) so parallel workers never upsert the same row.
+
+        Args:
+            item: The batch item
+
+        Returns:
+            A hashable key
+        """
+        return item.id
+
     def transform_source_data(
-        self, source_data: Dict[str, Any], ctx: ImportContext
+        self, source_data: Dict[str, Any], ctx: "ImportContext"
     ) -> Dict[str, Any]:
         """
         Transform source data before processing.
@@ -207,3 +404,8 @@ class BaseProcessor(ABC):
         """
         # Default: assume 0.1 seconds per item
         return item_count * 0.1
+
+
+def _implements_async(processor_class: type) -> bool:
+    """Check whether a processor class processes items with process_item_async()."""
+    return processor_class.process_item_async is not BaseProcessor.process_item_async
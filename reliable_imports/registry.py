@@ -6,11 +6,12 @@ saving developer time by eliminating manual registration boilerplate.
 """
 
 import importlib
-import inspect
 import pkgutil
-from typing import Dict, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
 
-from .exceptions import ProcessorNotFoundError
+from .exceptions import ConfigurationError, ProcessorNotFoundError
 from .processor import BaseProcessor
 
 
@@ -25,7 +26,8 @@ class ProcessorRegistry:
     """
 
     def __init__(self):
-        self._processors: Dict[str, Type[BaseProcessor]] = {}
+        self._processors: Mapping[str, Type[BaseProcessor]] = {}
+        self._frozen = False
 
     def register(
         self, batch_type: str, processor_class: Type[BaseProcessor]
@@ -37,6 +39,11 @@ class ProcessorRegistry:
             batch_type: The batch type identifier
             processor_class: The processor class to register
         """
+        if self._frozen:
+            raise ConfigurationError(
+                f"Cannot register {batch_type!r}: registry is frozen"
+            )
+
         if not issubclass(processor_class, BaseProcessor):
             raise ValueError(
                 f"{processor_class.__name__} must inherit from BaseProcessor"
@@ -57,13 +64,13 @@ class ProcessorRegistry:
         Raises:
             ProcessorNotFoundError: If no processor is registered for the batch type
         """
-        if batch_type not in self._processors:
+        try:
+            return self._processors[batch_type]
+        except KeyError:
             raise ProcessorNotFoundError(
                 f"No processor registered for batch type: {batch_type}. "
                 f"Available types: {', '.join(self._processors.keys())}"
-            )
-
-        return self._processors[batch_type]
+            ) from None
 
     def has(self, batch_type: str) -> bool:
         """Check if a processor is registered for a batch type."""
@@ -73,7 +80,17 @@ class ProcessorRegistry:
         """Get all registered batch types."""
         return list(self._processors.keys())
 
-    def discover(self, package_name: str) -> int:
+    def freeze(self) -> None:
+        """
+        Make the registry read-only once all processors are registered.
+
+        Lookups then go through a read-only mapping, and further register()
+        calls raise ConfigurationError.
+        """
+        self._processors = MappingProxyType(dict(self._processors))
+        self._frozen = True
+
+    def discover(self, package_name: str, workers: int = 1) -> int:
         """
         Automatically discover and register processors in a package.
 
@@ -85,6 +102,11 @@ class ProcessorRegistry:
 
         Args:
             package_name: Python package to search (e.g., 'myapp.processors')
+            workers: Number of threads to import the package's modules on.
+                Helps when modules spend their import time in I/O or C
+                extension setup; registration itself stays serial and in
+                module order. Modules that fail to import in parallel are
+                retried serially.
 
         Returns:
             Number of processors discovered and registered
@@ -110,11 +132,29 @@ class ProcessorRegistry:
 
         # Discover all modules in package
         if package_path:
-            for importer, modname, ispkg in pkgutil.walk_packages(
-                path=package_path, prefix=package_name + '.'
-            ):
+            modnames = [
+                modname
+                for importer, modname, ispkg in pkgutil.walk_packages(
+                    path=package_path, prefix=package_name + '.'
+                )
+            ]
+
+            imported = {}
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        modname: executor.submit(importlib.import_module, modname)
+                        for modname in modnames
+                    }
+                imported = {
+                    modname: future.result()
+                    for modname, future in futures.items()
+                    if future.exception() is None
+                }
+
+            for modname in modnames:
                 try:
-                    module = importlib.import_module(modname)
+                    module = imported.get(modname) or importlib.import_module(modname)
                     count += self._register_processors_in_module(module)
                 except Exception as e:
                     # Log but don't fail on import errors
@@ -129,22 +169,48 @@ class ProcessorRegistry:
         """Register all processor classes found in a module."""
         count = 0
 
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        # vars() rather than inspect.getmembers(), as in EndpointRegistry: no
+        # getattr() per attribute and no sorting
+        for obj in vars(module).values():
             # Check if it's a processor (but not the base class itself)
             if (
-                issubclass(obj, BaseProcessor)
+                isinstance(obj, type)
+                and issubclass(obj, BaseProcessor)
                 and obj is not BaseProcessor
                 and obj.__module__ == module.__name__
+                and _implements_processing(obj)
             ):
-                # Create instance to get batch_type
-                instance = obj()
-                if instance.batch_type:
-                    self.register(instance.batch_type, obj)
+                # batch_type is set on the class when it is defined, so the
+                # processor's __init__ does not need to run here
+                if obj.batch_type:
+                    self.register(obj.batch_type, obj)
                     count += 1
 
         return count
 
 
+def _implements_processing(processor_class: Type[BaseProcessor]) -> bool:
+    """
+    Check that a processor class implements the methods every processor needs.
+
+    That is validate_and_process_items(), or validate_item() together with
+    one of process_items(), process_item() and process_item_async().
+    Intermediate base classes that leave them to subclasses are skipped by
+    discovery rather than registered under their own batch_type.
+    """
+
+    def overrides(name: str) -> bool:
+        return getattr(processor_class, name) is not getattr(BaseProcessor, name)
+
+    if overrides("validate_and_process_items"):
+        return True
+    return overrides("validate_item") and (
+        overrides("process_items")
+        or overrides("process_item")
+        or overrides("process_item_async")
+    )
+
+
 # Global registry instance
 _default_registry = ProcessorRegistry()
 
@@ -0,0 +1,114 @@
+"""
+Shared fixtures for the test suite.
+
+Tests that need a database run against the PostgreSQL server named by the
+RELIABLE_IMPORTS_TEST_DSN environment variable, e.g.
+
+    RELIABLE_IMPORTS_TEST_DSN=postgresql://localhost/reliable_imports_test
+
+and are skipped when it is not set. The schema of that database is dropped
+and recreated for every test, so never point it at real data.
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+from reliable_imports import BaseProcessor, BatchManager
+from reliable_imports.registry import ProcessorRegistry
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_SQL = ROOT / "reliable_imports" / "schema.sql"
+
+
+def load_example(name):
+    """Import a script from examples/ as a module, without running its main()."""
+    spec = importlib.util.spec_from_file_location(name, ROOT / "examples" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class SampleProcessor(BaseProcessor):
+    """
+    Processor used across tests.
+
+    Items with `"fail": true` in their source data raise in process_item(),
+    and items with `"invalid": true` fail validation.
+    """
+
+    def validate_item(self, item, ctx):
+        return not item.source_data.get("invalid")
+
+    def process_item(self, item, ctx):
+        if item.source_data.get("fail"):
+            raise ValueError(f"bad item {item.item_index}")
+        return {"processed_data": {"index": item.item_index}}
+
+
+@pytest.fixture
+def dsn():
+    """Connection string of a test database with a freshly created schema."""
+    dsn = os.environ.get("RELIABLE_IMPORTS_TEST_DSN")
+    if not dsn:
+        pytest.skip("RELIABLE_IMPORTS_TEST_DSN is not set")
+
+    psycopg2 = pytest.importorskip("psycopg2")
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DROP SCHEMA public CASCADE; CREATE SCHEMA public")
+            cur.execute(SCHEMA_SQL.read_text())
+    finally:
+        conn.close()
+    return dsn
+
+
+@pytest.fixture
+def registry():
+    """An empty processor registry, so tests never touch the global one."""
+    return ProcessorRegistry()
+
+
+@pytest.fixture
+def manager(dsn, registry):
+    """A BatchManager on the test database, closed after the test."""
+    manager = BatchManager(dsn, registry=registry, max_conn=5)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def item_statuses(query):
+    """Map a batch's item_index to its status."""
+
+    def statuses(batch_id):
+        return dict(
+            query(
+                "SELECT item_index, status FROM import_batch_items "
+                "WHERE batch_id = %s ORDER BY item_index",
+                (batch_id,),
+            )
+        )
+
+    return statuses
+
+
+@pytest.fixture
+def query(dsn):
+    """Run and commit a statement on its own connection; return its rows, if any."""
+    import psycopg2
+
+    def run(sql, params=None):
+        conn = psycopg2.connect(dsn)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(sql, params)
+                return cur.fetchall() if cur.description else None
+        finally:
+            conn.close()
+
+    return run
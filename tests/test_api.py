@@ -0,0 +1,246 @@
+"""
+Behavior tests for the REST API against a real database.
+"""
+
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from reliable_imports import APIManager, BaseEndpoint
+from reliable_imports.api_registry import EndpointRegistry
+
+from conftest import SampleProcessor
+
+
+class RejectingProcessor(SampleProcessor):
+    """Fails every batch in validate_batch()."""
+
+    def validate_batch(self, ctx):
+        return False
+
+
+@pytest.fixture
+def events():
+    """Names of the endpoint hooks and processor calls, in call order."""
+    return []
+
+
+@pytest.fixture
+def endpoint_registry(registry, events):
+    class TracingProcessor(SampleProcessor):
+        def process_item(self, item, ctx):
+            events.append("process_item")
+            return super().process_item(item, ctx)
+
+    class TracingEndpoint(BaseEndpoint):
+        def after_create_batch(self, batch_id, request_data, ctx):
+            events.append("after_create_batch")
+
+        def after_batch_complete(self, batch_id, summary, ctx):
+            events.append("after_batch_complete")
+
+        def on_batch_error(self, batch_id, error, ctx):
+            events.append("on_batch_error")
+
+    registry.register("traced", TracingProcessor)
+    registry.register("rejected", RejectingProcessor)
+    registry.register("sample", SampleProcessor)
+
+    endpoints = EndpointRegistry()
+    endpoints.register("traced", TracingEndpoint)
+    endpoints.register("rejected", TracingEndpoint)
+    return endpoints
+
+
+def make_client(manager, endpoint_registry, **options):
+    api = APIManager(manager, endpoint_registry=endpoint_registry, **options)
+    return TestClient(api.app)
+
+
+def test_auto_process_runs_after_create_hook_first(manager, endpoint_registry, events):
+    client = make_client(manager, endpoint_registry)
+
+    response = client.post(
+        "/api/batches",
+        json={"batch_type": "traced", "items": [{}, {}], "auto_process": True},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["status"] == "completed"
+    assert events == ["after_create_batch", "process_item", "process_item"]
+
+
+def test_auto_process_without_endpoint_reports_final_status(manager, endpoint_registry):
+    client = make_client(manager, endpoint_registry)
+
+    response = client.post(
+        "/api/batches",
+        json={"batch_type": "sample", "items": [{}], "auto_process": True},
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["status"] == "completed"
+    assert manager.get_batch_summary(body["batch_id"]).completed_items == 1
+
+
+def test_background_auto_process_runs_completion_hook(manager, endpoint_registry, events):
+    client = make_client(manager, endpoint_registry, background_processing=True)
+
+    response = client.post(
+        "/api/batches",
+        json={"batch_type": "traced", "items": [{}], "auto_process": True},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["status"] == "processing"
+    # TestClient runs background tasks before returning the response
+    assert events == ["after_create_batch", "process_item", "after_batch_complete"]
+
+
+def test_background_auto_process_runs_error_hook(manager, endpoint_registry, events):
+    client = make_client(manager, endpoint_registry, background_processing=True)
+
+    response = client.post(
+        "/api/batches",
+        json={"batch_type": "rejected", "items": [{}], "auto_process": True},
+    )
+
+    assert response.status_code == 201
+    assert events == ["after_create_batch", "on_batch_error"]
+    summary = manager.get_batch_summary(response.json()["batch_id"])
+    assert summary.status.value == "failed"
+
+
+def test_process_route_returns_summary(manager, endpoint_registry, events):
+    client = make_client(manager, endpoint_registry)
+    batch_id = manager.create_batch("traced", [{}, {"fail": True}])
+
+    response = client.post(f"/api/batches/{batch_id}/process", json={})
+
+    assert response.status_code == 200
+    summary = response.json()["summary"]
+    assert (summary["completed_items"], summary["failed_items"]) == (1, 1)
+    assert events == ["process_item", "process_item", "after_batch_complete"]
+
+
+def test_unknown_batch(manager, endpoint_registry):
+    client = make_client(manager, endpoint_registry)
+
+    response = client.get(f"/api/batches/{uuid4()}")
+
+    assert response.status_code == 404
+
+
+def test_unknown_batch_type(manager, endpoint_registry):
+    client = make_client(manager, endpoint_registry)
+
+    response = client.post("/api/batches", json={"batch_type": "missing", "items": [{}]})
+
+    assert response.status_code == 400
+
+
+async def post_batches(app, requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.post(url, json=body) for url, body in requests)
+        )
+
+
+def test_coalesced_creates_share_one_insert(manager, endpoint_registry, monkeypatch):
+    calls = []
+    create_batches = manager.create_batches
+
+    def counting_create_batches(batches):
+        calls.append(len(batches))
+        return create_batches(batches)
+
+    monkeypatch.setattr(manager, "create_batches", counting_create_batches)
+    api = APIManager(
+        manager, endpoint_registry=endpoint_registry, create_coalesce_window=0.05
+    )
+
+    responses = asyncio.run(
+        post_batches(
+            api.app,
+            [("/api/batches", {"batch_type": "sample", "items": [{"n": n}]}) for n in range(3)]
+            + [("/api/batches?sync=true", {"batch_type": "sample", "items": [{}]})],
+        )
+    )
+
+    assert [response.status_code for response in responses] == [201] * 4
+    batch_ids = {response.json()["batch_id"] for response in responses}
+    assert len(batch_ids) == 4
+    assert calls == [3]
+    for response in responses:
+        summary = manager.get_batch_summary(response.json()["batch_id"])
+        assert summary.total_items == 1
+
+
+def test_bad_coalesced_create_fails_only_itself(manager, endpoint_registry, monkeypatch):
+    calls = []
+    create_batch = manager.create_batch
+
+    def counting_create_batch(**args):
+        calls.append(args["items"])
+        return create_batch(**args)
+
+    monkeypatch.setattr(manager, "create_batch", counting_create_batch)
+    api = APIManager(
+        manager, endpoint_registry=endpoint_registry, create_coalesce_window=0.05
+    )
+    items = [[{"n": 0}], [{"text": "nul \u0000 byte"}], [{"n": 2}]]
+
+    async def post_all():
+        transport = httpx.ASGITransport(app=api.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(
+                    client.post("/api/batches", json={"batch_type": "sample", "items": i})
+                    for i in items
+                )
+            )
+
+    responses = asyncio.run(post_all())
+
+    # Postgres rejects \u0000 in JSONB, so the group insert fails and each
+    # batch is retried on its own
+    assert [response.status_code for response in responses] == [201, 500, 201]
+    assert len(calls) == 3
+    for response in (responses[0], responses[2]):
+        summary = manager.get_batch_summary(response.json()["batch_id"])
+        assert summary.total_items == 1
+
+
+def test_concurrent_reads_share_one_summary_query(manager, endpoint_registry, monkeypatch):
+    calls = []
+    lock = threading.Lock()
+    get_batch_summary = manager.get_batch_summary
+
+    def slow_get_batch_summary(batch_id):
+        with lock:
+            calls.append(batch_id)
+        time.sleep(0.1)
+        return get_batch_summary(batch_id)
+
+    batch_id = manager.create_batch("sample", [{}])
+    monkeypatch.setattr(manager, "get_batch_summary", slow_get_batch_summary)
+    api = APIManager(manager, endpoint_registry=endpoint_registry)
+
+    async def read_batch():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.get(f"/api/batches/{batch_id}") for _ in range(5))
+            )
+
+    responses = asyncio.run(read_batch())
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert len(calls) == 1
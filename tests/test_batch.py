@@ -0,0 +1,345 @@
+"""
+Behavior tests for BatchManager against a real database.
+"""
+
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from reliable_imports import BaseProcessor, BatchManager
+from reliable_imports.exceptions import BatchNotFoundError, ProcessingError
+from reliable_imports.models import BatchStatus
+
+from conftest import SampleProcessor, load_example
+
+
+class ChunkedProcessor(SampleProcessor):
+    """Processes items five at a time, committing every ten."""
+
+    chunk_size = 5
+    commit_every = 10
+
+
+def test_process_batch_completes_items(manager, registry, item_statuses):
+    registry.register("sample", SampleProcessor)
+    batch_id = manager.create_batch("sample", [{"n": i} for i in range(3)])
+
+    summary = manager.process_batch(batch_id)
+
+    assert summary.status == BatchStatus.COMPLETED
+    assert summary.completed_items == 3
+    assert item_statuses(batch_id) == {0: "completed", 1: "completed", 2: "completed"}
+
+
+def test_invalid_items_are_skipped(manager, registry, item_statuses):
+    registry.register("sample", ChunkedProcessor)
+    batch_id = manager.create_batch("sample", [{}, {"invalid": True}, {}])
+
+    manager.process_batch(batch_id)
+
+    assert item_statuses(batch_id) == {0: "completed", 1: "skipped", 2: "completed"}
+
+
+def test_failing_chunk_is_retried_item_by_item(manager, registry, item_statuses, query):
+    registry.register("sample", ChunkedProcessor)
+    items = [{"fail": i == 7} for i in range(12)]
+    batch_id = manager.create_batch("sample", items)
+
+    summary = manager.process_batch(batch_id)
+
+    # Only the bad item fails; the rest of its chunk is retried and kept,
+    # as are the chunks before and after it in the same transaction
+    statuses = item_statuses(batch_id)
+    assert statuses.pop(7) == "failed"
+    assert set(statuses.values()) == {"completed"}
+    assert summary.status == BatchStatus.COMPLETED
+    assert summary.failed_items == 1
+
+    (error,) = query(
+        "SELECT error_message FROM import_batch_items WHERE batch_id = %s AND item_index = 7",
+        (batch_id,),
+    )
+    assert error == ("bad item 7",)
+
+
+def test_abort_on_error_marks_batch_failed(manager, registry, item_statuses):
+    class StrictProcessor(SampleProcessor):
+        def on_item_error(self, item, error, ctx):
+            return False
+
+    registry.register("sample", StrictProcessor)
+    batch_id = manager.create_batch("sample", [{}, {"fail": True}, {}])
+
+    with pytest.raises(ProcessingError):
+        manager.process_batch(batch_id, continue_on_error=False)
+
+    assert manager.get_batch_summary(batch_id).status == BatchStatus.FAILED
+    assert item_statuses(batch_id) == {0: "completed", 1: "failed", 2: "pending"}
+
+
+def test_customer_example_keeps_good_items_of_a_failing_chunk(
+    manager, registry, item_statuses
+):
+    example = load_example("customer_import_example")
+    registry.register("customer_data", example.CustomerDataProcessor)
+
+    # A phone number too long for its column fails the chunk's COPY
+    items = [
+        {
+            "email": f"user{i}@example.com",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "phone": "5" * (30 if i == 2 else 7),
+        }
+        for i in range(6)
+    ]
+    batch_id = manager.create_batch("customer_data", items)
+
+    manager.process_batch(batch_id)
+
+    statuses = item_statuses(batch_id)
+    assert statuses.pop(2) == "failed"
+    assert set(statuses.values()) == {"completed"}
+
+
+def test_iter_batch_items_pages_by_item_index(manager, registry):
+    registry.register("sample", SampleProcessor)
+    batch_id = manager.create_batch("sample", [{"n": i} for i in range(10)])
+
+    with manager._get_connection() as conn:
+        items = list(manager._iter_batch_items(conn, batch_id, page_size=3))
+
+    assert [item.item_index for item in items] == list(range(10))
+    assert [item.source_data["n"] for item in items] == list(range(10))
+
+
+def test_iter_batch_items_leaves_out_finished_items(manager, registry, query):
+    registry.register("sample", SampleProcessor)
+    batch_id = manager.create_batch("sample", [{} for _ in range(7)])
+    query(
+        "UPDATE import_batch_items SET status = 'completed' "
+        "WHERE batch_id = %s AND item_index IN (0, 3, 4)",
+        (batch_id,),
+    )
+
+    with manager._get_connection() as conn:
+        items = list(manager._iter_batch_items(conn, batch_id, page_size=2))
+
+    assert [item.item_index for item in items] == [1, 2, 5, 6]
+
+
+def test_create_batch_with_copy(dsn, registry):
+    registry.register("sample", SampleProcessor)
+    with BatchManager(dsn, registry=registry, copy_threshold=2) as manager:
+        batch_id = manager.create_batch(
+            "sample", [{"text": 'quote " and, comma'}, {"n": 1}, {}]
+        )
+        with manager._get_connection() as conn:
+            items = list(manager._iter_batch_items(conn, batch_id))
+
+    assert [item.source_data for item in items] == [
+        {"text": 'quote " and, comma'},
+        {"n": 1},
+        {},
+    ]
+
+
+def test_create_batches_in_one_call(manager, registry, item_statuses):
+    registry.register("sample", SampleProcessor)
+
+    first, second = manager.create_batches(
+        [
+            {"batch_type": "sample", "items": [{}, {}]},
+            {"batch_type": "sample", "items": [{}], "metadata": {"source": "b"}},
+        ]
+    )
+
+    assert item_statuses(first) == {0: "pending", 1: "pending"}
+    assert item_statuses(second) == {0: "pending"}
+    assert manager.get_batch_summary(second).total_items == 1
+
+
+def test_create_and_process(manager, registry, item_statuses):
+    registry.register("sample", SampleProcessor)
+
+    batch_id, summary = manager.create_and_process("sample", [{}, {"fail": True}])
+
+    assert summary.id == batch_id
+    assert summary.completed_items == 1
+    assert summary.failed_items == 1
+    assert item_statuses(batch_id) == {0: "completed", 1: "failed"}
+
+
+def test_sharded_processing_keeps_keys_on_one_connection(manager, registry, item_statuses):
+    seen = {}
+    lock = threading.Lock()
+
+    class KeyedProcessor(SampleProcessor):
+        chunk_size = 4
+
+        def get_shard_key(self, item):
+            return item.source_data["key"]
+
+        def process_item(self, item, ctx):
+            with lock:
+                seen.setdefault(item.source_data["key"], set()).add(id(ctx.conn))
+            return super().process_item(item, ctx)
+
+    registry.register("sample", KeyedProcessor)
+    batch_id = manager.create_batch("sample", [{"key": i % 7} for i in range(300)])
+
+    summary = manager.process_batch(batch_id, workers=3)
+
+    assert summary.completed_items == 300
+    assert set(item_statuses(batch_id).values()) == {"completed"}
+    assert all(len(conns) == 1 for conns in seen.values())
+    assert len(set().union(*seen.values())) > 1
+
+
+def test_concurrent_sharded_batches_do_not_exhaust_the_pool(dsn, registry):
+    registry.register("sample", ChunkedProcessor)
+    with BatchManager(dsn, registry=registry, max_conn=3) as manager:
+        batch_ids = [manager.create_batch("sample", [{} for _ in range(50)]) for _ in range(3)]
+        summaries = {}
+
+        def process(batch_id):
+            summaries[batch_id] = manager.process_batch(batch_id, workers=2)
+
+        threads = [threading.Thread(target=process, args=(b,), daemon=True) for b in batch_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert not any(thread.is_alive() for thread in threads), "batches deadlocked"
+        assert [summaries[b].completed_items for b in batch_ids] == [50, 50, 50]
+
+
+def test_aborting_shard_stops_the_others(manager, registry, item_statuses):
+    started = []
+    aborted = []
+    lock = threading.Lock()
+
+    class StrictProcessor(ChunkedProcessor):
+        def process_item(self, item, ctx):
+            with lock:
+                started.append((time.monotonic(), item.item_index))
+            return super().process_item(item, ctx)
+
+        def on_item_error(self, item, error, ctx):
+            aborted.append(time.monotonic())
+            return False
+
+    registry.register("sample", StrictProcessor)
+    batch_id = manager.create_batch("sample", [{"fail": i == 3} for i in range(500)])
+
+    with pytest.raises(ProcessingError):
+        manager.process_batch(batch_id, workers=3, continue_on_error=False)
+
+    summary = manager.get_batch_summary(batch_id)
+    assert summary.status == BatchStatus.FAILED
+    assert summary.failed_items == 1
+    assert summary.pending_items > 0
+
+    # The other shards may finish the chunk they are in, but start no more
+    (abort_time,) = aborted
+    late = [index for started_at, index in started if started_at > abort_time]
+    assert len(late) < 2 * StrictProcessor.chunk_size
+    completed = [i for i, status in item_statuses(batch_id).items() if status == "completed"]
+    assert len(completed) == summary.completed_items
+    assert len(completed) <= len(started) - 1
+
+
+def test_reprocess_copies_failed_items(manager, registry, query):
+    registry.register("sample", SampleProcessor)
+    batch_id = manager.create_batch(
+        "sample",
+        [{"n": 0}, {"n": 1, "fail": True}, {"n": 2}, {"n": 3, "fail": True}],
+        source_info={"file": "a.csv"},
+    )
+    manager.process_batch(batch_id)
+
+    new_batch_id = manager.reprocess_batch(batch_id)
+
+    assert new_batch_id != batch_id
+    rows = query(
+        "SELECT item_index, source_data FROM import_batch_items "
+        "WHERE batch_id = %s ORDER BY item_index",
+        (new_batch_id,),
+    )
+    assert rows == [(0, {"n": 1, "fail": True}), (1, {"n": 3, "fail": True})]
+    assert query(
+        "SELECT parent_batch_id, source_info FROM import_batches WHERE id = %s",
+        (new_batch_id,),
+    ) == [(str(batch_id), {"file": "a.csv"})]
+
+
+def test_reprocess_without_failures_returns_original_batch(manager, registry, query):
+    registry.register("sample", SampleProcessor)
+    batch_id = manager.create_batch("sample", [{}, {}])
+    manager.process_batch(batch_id)
+
+    assert manager.reprocess_batch(batch_id) == batch_id
+    assert query("SELECT COUNT(*) FROM import_batches") == [(1,)]
+
+
+def test_reprocess_unknown_batch(manager):
+    with pytest.raises(BatchNotFoundError):
+        manager.reprocess_batch(uuid4())
+
+
+def test_processor_is_created_per_batch_unless_reused(manager, registry):
+    class SharedProcessor(SampleProcessor):
+        reuse_instance = True
+
+    registry.register("sample", SampleProcessor)
+    registry.register("shared", SharedProcessor)
+
+    assert manager._get_processor("sample") is not manager._get_processor("sample")
+    assert manager._get_processor("shared") is manager._get_processor("shared")
+
+
+def test_async_processor_keeps_one_loop_per_batch(manager, registry, item_statuses):
+    loops = set()
+
+    class FetchProcessor(BaseProcessor):
+        chunk_size = 4
+
+        def validate_item(self, item, ctx):
+            return True
+
+        async def process_item_async(self, item, ctx):
+            await asyncio.sleep(0)
+            loops.add(asyncio.get_running_loop())
+            return {}
+
+    registry.register("fetch", FetchProcessor)
+    batch_id = manager.create_batch("fetch", [{} for _ in range(12)])
+
+    manager.process_batch(batch_id)
+
+    assert len(loops) == 1
+    assert set(item_statuses(batch_id).values()) == {"completed"}
+
+
+def test_async_processor_refuses_a_running_loop(manager, registry):
+    class FetchProcessor(BaseProcessor):
+        def validate_item(self, item, ctx):
+            return True
+
+        async def process_item_async(self, item, ctx):
+            return {}
+
+    registry.register("fetch", FetchProcessor)
+    batch_id = manager.create_batch("fetch", [{}])
+
+    async def process():
+        manager.process_batch(batch_id)
+
+    with pytest.raises(ProcessingError, match="running event loop"):
+        asyncio.run(process())
+
+    assert manager.get_batch_summary(batch_id).status == BatchStatus.PENDING
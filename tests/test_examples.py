@@ -0,0 +1,129 @@
+"""
+Tests for the processors and helpers in examples/.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from conftest import load_example
+
+
+@pytest.fixture
+def api_example():
+    return load_example("api_example")
+
+
+@pytest.fixture(params=["pyarrow", "csv"])
+def csv_loader(request, monkeypatch):
+    """load_customers_from_csv, with PyArrow importable and with it blocked."""
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow.csv")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+    return load_example("customer_import_example").load_customers_from_csv
+
+
+def test_api_example_processor_upserts_valid_customers(
+    manager, registry, item_statuses, query, api_example
+):
+    query(
+        "CREATE TABLE customers (id UUID PRIMARY KEY, email TEXT UNIQUE NOT NULL, "
+        "name TEXT NOT NULL, created_at TIMESTAMPTZ, updated_at TIMESTAMPTZ)"
+    )
+    registry.register("customer_data", api_example.CustomerDataProcessor)
+    batch_id = manager.create_batch(
+        "customer_data",
+        [
+            {"email": "ada@example.com", "name": "Ada"},
+            {"email": "not-an-email", "name": "Bad"},
+            {"email": "grace@example.com"},
+            {"email": "alan@example.com", "name": "Alan"},
+        ],
+    )
+
+    manager.process_batch(batch_id)
+
+    assert item_statuses(batch_id) == {
+        0: "completed",
+        1: "skipped",
+        2: "skipped",
+        3: "completed",
+    }
+    assert query("SELECT email, name FROM customers ORDER BY email") == [
+        ("ada@example.com", "Ada"),
+        ("alan@example.com", "Alan"),
+    ]
+
+
+def test_rate_limiter_forgets_refilled_buckets(api_example, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(api_example.time, "monotonic", lambda: now[0])
+    limiter = api_example.TokenBucketRateLimiter(capacity=2, refill_per_second=1.0)
+
+    assert [limiter.allow("ada") for _ in range(3)] == [True, True, False]
+    limiter.allow("grace")
+
+    # grace refills after one second and ada after two; a sweep runs at
+    # most once per full-refill interval (two seconds here)
+    now[0] += 2.5
+    assert limiter.allow("alan")
+    assert set(limiter._buckets) == {"alan"}
+    assert [limiter.allow("ada") for _ in range(3)] == [True, True, False]
+
+
+def test_notifications_racing_shutdown_are_printed(api_example, capsys):
+    dispatcher = api_example.NotificationDispatcher(flush_delay=60)
+
+    async def scenario():
+        await dispatcher.start()
+        dispatcher.send("created", key="batch")
+        dispatcher.send("plain")
+        await dispatcher.stop()
+        # Callbacks a send() scheduled just before stop() cleared the loop
+        dispatcher._hold("batch", "late held")
+        dispatcher._enqueue("late plain")
+        dispatcher.send("after stop", key="batch")
+
+    asyncio.run(scenario())
+
+    assert dispatcher._loop is None
+    assert dispatcher._timers == {}
+    assert capsys.readouterr().out.splitlines() == [
+        "[NOTIFICATION] plain",
+        "[NOTIFICATION] created",
+        "[NOTIFICATION] late held",
+        "[NOTIFICATION] late plain",
+        "[NOTIFICATION] after stop",
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, rows",
+    [
+        ("", []),
+        ("email,first_name\n", []),
+        (
+            'email,first_name\nada@example.com,"Ada, Countess"\n\ngrace@example.com,\n',
+            [
+                {"email": "ada@example.com", "first_name": "Ada, Countess"},
+                {"email": "grace@example.com", "first_name": ""},
+            ],
+        ),
+        (
+            "email,first_name,phone\nada@example.com,Ada,5551234\nalan@example.com\n",
+            [
+                {"email": "ada@example.com", "first_name": "Ada", "phone": "5551234"},
+                {"email": "alan@example.com", "first_name": None, "phone": None},
+            ],
+        ),
+    ],
+    ids=["empty", "header-only", "quoted", "short-row"],
+)
+def test_csv_loader_returns_the_same_rows_either_way(csv_loader, tmp_path, text, rows):
+    path = tmp_path / "customers.csv"
+    path.write_text(text)
+
+    assert csv_loader(str(path)) == rows
@@ -0,0 +1,132 @@
+"""
+Tests for processor registration, discovery and batch_type derivation.
+"""
+
+import sys
+import textwrap
+
+import pytest
+
+from reliable_imports import BaseProcessor
+from reliable_imports.exceptions import ConfigurationError, ProcessorNotFoundError
+from reliable_imports.registry import ProcessorRegistry
+
+PROCESSORS_MODULE = '''
+from reliable_imports import BaseProcessor
+
+
+class ItemProcessor(BaseProcessor):
+    def validate_item(self, item, ctx):
+        return True
+
+    def process_item(self, item, ctx):
+        return {}
+
+
+class ChunkProcessor(BaseProcessor):
+    def validate_item(self, item, ctx):
+        return True
+
+    def process_items(self, items, ctx):
+        return [{} for _ in items]
+
+
+class OnePassProcessor(BaseProcessor):
+    def validate_and_process_items(self, items, ctx):
+        return [{} for _ in items]
+
+
+class AsyncFetchProcessor(BaseProcessor):
+    def validate_item(self, item, ctx):
+        return True
+
+    async def process_item_async(self, item, ctx):
+        return {}
+
+
+class NamedProcessor(ItemProcessor):
+    batch_type = "custom_name"
+
+
+class BaseCsvProcessor(BaseProcessor):
+    """Intermediate base class: leaves the work to subclasses."""
+
+    def validate_item(self, item, ctx):
+        return True
+'''
+
+
+@pytest.fixture
+def processors_package(tmp_path, monkeypatch):
+    """A package with one module of processors, importable for the test."""
+    package = tmp_path / "sample_processors"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "imports.py").write_text(textwrap.dedent(PROCESSORS_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "sample_processors"
+    for name in ("sample_processors", "sample_processors.imports"):
+        sys.modules.pop(name, None)
+
+
+def test_batch_type_is_derived_from_the_class_name():
+    class CustomerDataProcessor(BaseProcessor):
+        pass
+
+    class CustomerDataV2Processor(CustomerDataProcessor):
+        pass
+
+    class ExplicitProcessor(BaseProcessor):
+        batch_type = "explicit_type"
+
+    class ExplicitChildProcessor(ExplicitProcessor):
+        pass
+
+    assert CustomerDataProcessor.batch_type == "customer_data"
+    assert CustomerDataV2Processor.batch_type == "customer_data_v2"
+    assert ExplicitProcessor.batch_type == "explicit_type"
+    assert ExplicitChildProcessor.batch_type == "explicit_type"
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_discover_registers_every_complete_processor(processors_package, workers):
+    registry = ProcessorRegistry()
+
+    count = registry.discover(processors_package, workers=workers)
+
+    assert sorted(registry.list_batch_types()) == [
+        "async_fetch",
+        "chunk",
+        "custom_name",
+        "item",
+        "one_pass",
+    ]
+    assert count == 5
+
+
+def test_unknown_batch_type():
+    registry = ProcessorRegistry()
+
+    with pytest.raises(ProcessorNotFoundError):
+        registry.get("missing")
+
+
+def test_register_rejects_non_processors():
+    registry = ProcessorRegistry()
+
+    with pytest.raises(ValueError):
+        registry.register("thing", object)
+
+
+def test_frozen_registry_rejects_registration():
+    class SomeProcessor(BaseProcessor):
+        pass
+
+    registry = ProcessorRegistry()
+    registry.register("some", SomeProcessor)
+    registry.freeze()
+
+    with pytest.raises(ConfigurationError):
+        registry.register("other", SomeProcessor)
+    assert registry.get("some") is SomeProcessor
+    assert registry.has("some")